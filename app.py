@@ -6,7 +6,7 @@ from components.personnel_analysis import show_personnel_analysis
 from components.negative_margin import show_negative_margin_analysis
 from components.project_details import show_project_details
 from components.ai_analysis import show_ai_analysis
-from data_processor import load_and_process_data
+from data_processor import DEFAULT_METRICS, get_date_index, get_filter_engine, load_and_process_data, with_metrics
 
 # Simple password protection
 st.set_page_config(
@@ -207,10 +207,17 @@ st.sidebar.title("Navigation")
 # Add global filters
 st.sidebar.markdown('<h2 class="sub-header">Filters</h2>', unsafe_allow_html=True)
 
+# Filters are resolved by a per-dataset engine that caches row selections
+filter_engine = get_filter_engine(projects_df)
+selected_dates = None
+selected_region = None
+
 # Filter by date if date column exists
 if 'Projected End Date' in projects_df.columns:
-    min_date = pd.to_datetime(projects_df['Projected End Date']).min()
-    max_date = pd.to_datetime(projects_df['Projected End Date']).max()
+    # Dates are sorted once per dataset, so the range filter is a binary search
+    date_index = get_date_index(projects_df, 'Projected End Date')
+    min_date = date_index.min
+    max_date = date_index.max
     
     # Set default date range to Q1 2025
     default_start = pd.Timestamp('2025-01-01')
@@ -229,17 +236,20 @@ if 'Projected End Date' in projects_df.columns:
     
     # Apply date filter if selected
     if len(date_range) == 2:
-        start_date, end_date = date_range
-        projects_df = projects_df[(pd.to_datetime(projects_df['Projected End Date']).dt.date >= start_date) & 
-                                 (pd.to_datetime(projects_df['Projected End Date']).dt.date <= end_date)]
+        selected_dates = tuple(date_range)
 
 # Filter by region
 if 'Region' in projects_df.columns:
-    regions = ['All'] + sorted(projects_df['Region'].dropna().unique().tolist())
+    regions = ['All'] + filter_engine.regions(selected_dates)
     selected_region = st.sidebar.selectbox("Region", regions)
     
-    if selected_region != 'All':
-        projects_df = projects_df[projects_df['Region'] == selected_region]
+    if selected_region == 'All':
+        selected_region = None
+
+# The filtered rows and their derived metric columns are computed once per
+# filter state and shared across reruns and sessions; pages get a shallow
+# copy, so columns they add or replace stay local to this rerun
+projects_df = with_metrics(filter_engine.view(selected_region, selected_dates), DEFAULT_METRICS).copy(deep=False)
 
 # Add navigation buttons section
 st.sidebar.markdown('<h2 class="sub-header">Views</h2>', unsafe_allow_html=True)
@@ -0,0 +1 @@
+"""Performance benchmarks for Project Profit Pulse. Run each module with ``python -m benchmarks.<name>``."""
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""
+Benchmark incremental ingest: loading Projects.csv after rows were
+appended, against rebuilding it from scratch.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_append [rows] [appended rows]
+
+For the full and streaming loaders, appends normal rows, rows with blank
+notes and rows with blank dates: once after a restart, so the base frame
+comes from the sidecar, and once more in-process. Reports the seconds of
+each and checks that both results equal a full rebuild, values and dtypes.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import make_projects, write_dataset
+from data_processor import clear_cache, get_cache_stats, load_and_process_data, sidecar_path
+
+# Appended rows, and the column each scenario leaves blank
+SCENARIOS = (
+    ("rows", None),
+    ("blank notes", 'Project Notes'),
+    ("blank dates", 'Projected End Date'),
+)
+# chunksize 0 forces a full load; a positive one streams
+MODES = (("full", 0), ("streaming", 10_000))
+
+
+def _identical(left: pd.DataFrame, right: pd.DataFrame) -> bool:
+    try:
+        pd.testing.assert_frame_equal(left, right)
+    except AssertionError:
+        return False
+    return True
+
+
+def _timed_load(summary_path: str, projects_path: str, chunksize: int) -> tuple:
+    """Return (seconds, projects frame, whether appended rows were processed on their own)"""
+    appends = get_cache_stats()["appends"]
+    start = time.perf_counter()
+    _, projects = load_and_process_data(summary_path, projects_path, chunksize)
+    return time.perf_counter() - start, projects, get_cache_stats()["appends"] > appends
+
+
+def _rebuild(summary_path: str, projects_path: str, chunksize: int) -> tuple:
+    """Load from scratch, without the in-process cache or sidecar"""
+    clear_cache()
+    shutil.rmtree(os.path.dirname(sidecar_path(projects_path)), ignore_errors=True)
+    return _timed_load(summary_path, projects_path, chunksize)
+
+
+def _append_rows(projects_path: str, rows: int, seed: int, blank) -> None:
+    new_rows = make_projects(rows, seed=seed)
+    if blank is not None:
+        new_rows[blank] = np.nan
+    new_rows.to_csv(projects_path, mode="a", header=False, index=False)
+
+
+def run(rows: int = 100_000, appended: int = 3) -> list:
+    """
+    In each mode and scenario, append after a restart (base from the
+    sidecar) and then again in-process (base from the cache); returns
+    one dict per pair.
+    """
+    results = []
+    for mode, chunksize in MODES:
+        for scenario, blank in SCENARIOS:
+            with tempfile.TemporaryDirectory() as tmp:
+                summary_path, projects_path = write_dataset(tmp, rows)
+                clear_cache()
+                load_and_process_data(summary_path, projects_path, chunksize)
+
+                _append_rows(projects_path, appended, 1, blank)
+                clear_cache()
+                restart_s, restarted, restart_appended = _timed_load(summary_path, projects_path, chunksize)
+                _append_rows(projects_path, appended, 2, blank)
+                cached_s, cached, cached_appended = _timed_load(summary_path, projects_path, chunksize)
+                rebuild_s, rebuilt, _ = _rebuild(summary_path, projects_path, chunksize)
+                restart_identical = _identical(restarted, rebuilt.iloc[:len(restarted)])
+                clear_cache()
+            results.append({
+                "mode": mode,
+                "scenario": scenario,
+                "rows": rows,
+                "appended": appended,
+                "restart_seconds": round(restart_s, 4),
+                "append_seconds": round(cached_s, 4),
+                "rebuild_seconds": round(rebuild_s, 4),
+                "incremental": restart_appended and cached_appended,
+                "identical": _identical(cached, rebuilt) and restart_identical,
+            })
+    return results
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    appended = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    print(f"{'mode':<11}{'scenario':<13}{'restart s':>11}{'append s':>10}{'rebuild s':>11}{'incremental':>13}{'identical':>11}")
+    for result in run(rows, appended):
+        print(f"{result['mode']:<11}{result['scenario']:<13}{result['restart_seconds']:>11}{result['append_seconds']:>10}"
+              f"{result['rebuild_seconds']:>11}{str(result['incremental']):>13}{str(result['identical']):>11}")
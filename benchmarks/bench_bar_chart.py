@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""
+Benchmark utils.create_bar_chart against the original one-trace-per-row
+renderer.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_bar_chart [rows ...]
+
+Reports figure build time, trace count and serialized JSON size.
+"""
+
+import sys
+import time
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from utils import create_bar_chart
+
+
+def make_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Per-project variances shaped like the dashboard's bar chart input"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Topic': [f"Project {i}" for i in range(rows)],
+        'Total Costs Variance $': rng.normal(0, 5000, rows),
+    })
+
+
+def legacy_create_bar_chart(df: pd.DataFrame, x: str, y: str, title: str) -> go.Figure:
+    """The per-row trace loop create_bar_chart used before, with the current layout"""
+    fig = go.Figure()
+    for i, row in df.iterrows():
+        value = row[y]
+        color = '#40CC5A' if value >= 0 else '#F04D4D'
+        fig.add_trace(go.Bar(x=[row[x]], y=[value], name=row[x], marker_color=color, showlegend=False))
+    fig.update_layout(create_bar_chart(df.head(0), x, y, title).layout)
+    return fig
+
+
+def _measure(func, *args) -> tuple:
+    """Return (seconds, traces, JSON bytes) for one figure build"""
+    start = time.perf_counter()
+    fig = func(*args)
+    elapsed = time.perf_counter() - start
+    return elapsed, len(fig.data), len(fig.to_json())
+
+
+def run(sizes=(100, 1_000, 5_000)) -> list:
+    """Build both figures at each size; returns one dict per size"""
+    results = []
+    for rows in sizes:
+        df = make_frame(rows)
+        args = (df, 'Topic', 'Total Costs Variance $', 'Cost Variance by Project')
+        legacy_s, legacy_traces, legacy_bytes = _measure(legacy_create_bar_chart, *args)
+        current_s, current_traces, current_bytes = _measure(create_bar_chart, *args)
+        results.append({
+            "rows": rows,
+            "legacy_seconds": round(legacy_s, 4),
+            "legacy_traces": legacy_traces,
+            "legacy_json_bytes": legacy_bytes,
+            "seconds": round(current_s, 4),
+            "traces": current_traces,
+            "json_bytes": current_bytes,
+            "speedup": round(legacy_s / current_s, 1) if current_s else None,
+        })
+    return results
+
+
+if __name__ == "__main__":
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or (100, 1_000, 5_000)
+    print(f"{'rows':>8}{'legacy s':>11}{'legacy KiB':>12}{'single s':>11}{'single KiB':>12}{'speedup':>9}")
+    for result in run(sizes):
+        print(f"{result['rows']:>8}{result['legacy_seconds']:>11}{result['legacy_json_bytes'] // 1024:>12}"
+              f"{result['seconds']:>11}{result['json_bytes'] // 1024:>12}{result['speedup']:>8}x")
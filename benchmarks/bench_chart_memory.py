@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+"""
+Measure per-chart memory allocation of the utils chart helpers on a wide
+frame, against the full ``df.copy()`` the helpers used to start with.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_chart_memory [rows] [extra_columns]
+
+Peak allocation is measured with tracemalloc. The "with copy" figure is
+the same helper called after a full copy of the frame, which is what the
+old implementation allocated up front. Each chart is built once untraced
+first, so Plotly's one-time allocations don't count against whichever
+path is measured first.
+"""
+
+import sys
+import tracemalloc
+import numpy as np
+import pandas as pd
+
+from utils import clear_figure_cache, create_bar_chart, create_line_chart
+
+
+def make_wide_frame(rows: int, extra_columns: int, seed: int = 0) -> pd.DataFrame:
+    """A projects-like frame with many columns the charts never plot"""
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame({
+        'Topic': [f"Project {i}" for i in range(rows)],
+        'Projected End Date': pd.Timestamp("2020-01-01") + pd.to_timedelta(np.arange(rows), unit="h"),
+        'Total Costs Variance $': rng.normal(0, 5000, rows),
+        'Actual Margin %': rng.normal(0.2, 0.15, rows),
+    })
+    extras = pd.DataFrame(rng.normal(size=(rows, extra_columns)),
+                          columns=[f"Unused {i}" for i in range(extra_columns)])
+    notes = pd.DataFrame({f"Notes {i}": ["free text " * 5] * rows for i in range(extra_columns // 10)})
+    return pd.concat([frame, extras, notes], axis=1)
+
+
+def _peak_mib(func) -> float:
+    clear_figure_cache()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / (1 << 20)
+
+
+def run(rows: int = 5_000, extra_columns: int = 60) -> list:
+    """Peak MiB per chart with and without the up-front copy"""
+    df = make_wide_frame(rows, extra_columns)
+    charts = {
+        "bar": lambda frame: create_bar_chart(frame, 'Topic', 'Total Costs Variance $', 'Cost Variance'),
+        "line": lambda frame: create_line_chart(frame, 'Projected End Date', 'Actual Margin %', 'Margin'),
+    }
+    results = []
+    for name, chart in charts.items():
+        # Untraced warm-up of both paths
+        for frame in (df, df.copy()):
+            clear_figure_cache()
+            chart(frame)
+        projected = _peak_mib(lambda: chart(df))
+        copied = _peak_mib(lambda: chart(df.copy()))
+        results.append({
+            "chart": name,
+            "rows": rows,
+            "columns": df.shape[1],
+            "frame_mib": round(df.memory_usage(deep=True).sum() / (1 << 20), 1),
+            "with_copy_peak_mib": round(copied, 2),
+            "projected_peak_mib": round(projected, 2),
+        })
+    return results
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    extra_columns = int(sys.argv[2]) if len(sys.argv) > 2 else 60
+    print(f"{'chart':<8}{'rows':>8}{'columns':>9}{'frame MiB':>11}{'copy MiB':>10}{'projected MiB':>15}")
+    for result in run(rows, extra_columns):
+        print(f"{result['chart']:<8}{result['rows']:>8}{result['columns']:>9}{result['frame_mib']:>11}"
+              f"{result['with_copy_peak_mib']:>10}{result['projected_peak_mib']:>15}")
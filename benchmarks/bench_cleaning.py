@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+"""
+Benchmark the schema-driven column cleaner against the original
+chained ``.str.replace`` implementation.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_cleaning [rows]
+
+Reports seconds per million rows for money, percent and date columns.
+"""
+
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+from data_processor import DATE, MONEY, PERCENT, clean_column
+
+
+def make_columns(rows: int, seed: int = 0) -> dict:
+    """Build raw string columns shaped like the Projects.csv export"""
+    rng = np.random.default_rng(seed)
+    amounts = rng.normal(0, 5000, rows)
+    money = [f"${value:,.2f}" if value >= 0 else f"-${-value:,.2f}" for value in amounts]
+    percents = np.char.add(np.char.mod("%.1f", rng.normal(20, 15, rows)), "%")
+    dates = pd.Series(pd.Timestamp("2020-01-01") + pd.to_timedelta(rng.integers(0, 1500, rows), unit="D")).dt.strftime("%m/%d/%Y")
+    return {
+        MONEY: pd.Series(money, dtype=object),
+        PERCENT: pd.Series(percents, dtype=object),
+        DATE: dates.astype(object),
+    }
+
+
+def legacy_clean(series: pd.Series, kind: str) -> pd.Series:
+    """The cleaning steps load_and_process_data used before the schema engine"""
+    if kind == MONEY:
+        series = series.str.replace('$', '', regex=False)
+        series = series.str.replace(',', '', regex=False)
+        series = series.str.replace(' ', '', regex=False)
+        return pd.to_numeric(series, errors='coerce')
+    if kind == PERCENT:
+        series = series.str.replace('%', '', regex=False)
+        return pd.to_numeric(series, errors='coerce') / 100
+    return pd.to_datetime(series, errors='coerce')
+
+
+def _time(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def run(rows: int = 1_000_000) -> list:
+    """Time both cleaners on each column kind; returns one dict per kind"""
+    results = []
+    scale = 1_000_000 / rows
+    for kind, series in make_columns(rows).items():
+        legacy = _time(legacy_clean, series, kind) * scale
+        current = _time(clean_column, series, kind) * scale
+        results.append({
+            "kind": kind,
+            "rows": rows,
+            "legacy_s_per_million": round(legacy, 4),
+            "schema_s_per_million": round(current, 4),
+            "speedup": round(legacy / current, 2) if current else None,
+        })
+    return results
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"{'kind':<10}{'legacy s/M':>14}{'schema s/M':>14}{'speedup':>10}")
+    for result in run(rows):
+        print(f"{result['kind']:<10}{result['legacy_s_per_million']:>14}{result['schema_s_per_million']:>14}{result['speedup']:>9}x")
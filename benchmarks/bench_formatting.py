@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+"""
+Benchmark the column formatters against mapping the scalar
+``format_currency`` / ``format_percentage`` over every cell.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_formatting [rows]
+
+Reports rows per second for numeric and text columns of each kind and
+checks that both paths produce identical strings. Text columns are
+mapped cell by cell by the column formatters too, so they run at about
+the scalar rate.
+"""
+
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+from utils import format_currency, format_currency_series, format_percentage, format_percentage_series
+
+
+def make_columns(rows: int, seed: int = 0) -> dict:
+    """Build numeric and exported-text columns shaped like Projects.csv"""
+    rng = np.random.default_rng(seed)
+    amounts = rng.normal(0, 50_000, rows).round(2)
+    margins = rng.normal(0.2, 0.15, rows)
+    money_text = [f"${value:,.2f}" if value >= 0 else f"(${-value:,.2f})" for value in amounts]
+    return {
+        "currency": (format_currency, format_currency_series, {
+            "numeric": pd.Series(amounts),
+            "text": pd.Series(money_text, dtype=object),
+        }),
+        "percentage": (format_percentage, format_percentage_series, {
+            "numeric": pd.Series(margins),
+            "text": pd.Series(np.char.add(np.char.mod("%.1f", margins * 100), "%"), dtype=object),
+        }),
+    }
+
+
+def _time(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def run(rows: int = 100_000) -> list:
+    """Time both formatters on each column; returns one dict per column"""
+    results = []
+    for kind, (scalar, vectorized, columns) in make_columns(rows).items():
+        for source, series in columns.items():
+            mapped_s, expected = _time(series.map, scalar)
+            vectorized_s, formatted = _time(vectorized, series)
+            results.append({
+                "kind": kind,
+                "source": source,
+                "rows": rows,
+                "map_rows_per_s": round(rows / mapped_s),
+                "vectorized_rows_per_s": round(rows / vectorized_s),
+                "speedup": round(mapped_s / vectorized_s, 2) if vectorized_s else None,
+                "identical": bool((formatted.to_numpy(dtype=object) == expected.to_numpy(dtype=object)).all()),
+            })
+    return results
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{'column':<22}{'map rows/s':>14}{'vector rows/s':>16}{'speedup':>10}{'identical':>11}")
+    for result in run(rows):
+        column = f"{result['kind']} ({result['source']})"
+        print(f"{column:<22}{result['map_rows_per_s']:>14,}{result['vectorized_rows_per_s']:>16,}"
+              f"{result['speedup']:>9}x{str(result['identical']):>11}")
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+"""
+Benchmark insights.local_negative_margin_analysis, the offline analysis
+shown when no model is available.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_insights [rows ...]
+
+Reports milliseconds per analysis on loaded frames and
+checks the output is identical when rows are shuffled.
+"""
+
+import sys
+import time
+import numpy as np
+
+from benchmarks.synthetic import make_projects
+from data_processor import process_projects
+from insights import local_negative_margin_analysis
+
+
+def run(sizes=(1_000, 100_000, 1_000_000), repeats: int = 3) -> list:
+    """Time the analysis at each size, best of ``repeats``; returns one dict per size"""
+    results = []
+    for rows in sizes:
+        projects = process_projects(make_projects(rows))
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            analysis = local_negative_margin_analysis(projects)
+            timings.append(time.perf_counter() - start)
+        shuffled = projects.iloc[np.random.default_rng(0).permutation(rows)]
+        results.append({
+            "rows": rows,
+            "ms": round(min(timings) * 1000, 1),
+            "findings": analysis.count("\n* "),
+            "order_independent": local_negative_margin_analysis(shuffled) == analysis,
+        })
+    return results
+
+
+if __name__ == "__main__":
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or (1_000, 100_000, 1_000_000)
+    print(f"{'rows':>9}{'ms':>9}{'findings':>10}{'order independent':>19}")
+    for result in run(sizes):
+        print(f"{result['rows']:>9}{result['ms']:>9}{result['findings']:>10}{str(result['order_independent']):>19}")
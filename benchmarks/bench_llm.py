@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+"""
+Benchmark the AI analysis path offline against llm.StubBackend: a model
+call, a cached response, concurrent duplicate requests, transient
+failures that are retried and a backend that times out.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_llm [latency seconds]
+
+Reports wall time, backend calls and the llm counters for each scenario.
+The response cache is pointed at a temporary directory.
+"""
+
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import llm
+import utils
+from benchmarks.synthetic import make_projects
+from data_processor import process_projects
+
+CONCURRENT_REQUESTS = 8
+
+
+def _scenario(name: str, backend: llm.StubBackend, action) -> dict:
+    llm.clear_llm_stats()
+    start = time.perf_counter()
+    try:
+        action(backend)
+        outcome = "ok"
+    except Exception as e:
+        outcome = type(e).__name__
+    return dict(llm.get_llm_stats(), scenario=name, seconds=round(time.perf_counter() - start, 3),
+                backend_calls=backend.calls, outcome=outcome)
+
+
+def run(latency: float = 0.5, rows: int = 1_000) -> list:
+    """Run each scenario on a fresh stub backend; returns one dict per scenario"""
+    projects = process_projects(make_projects(rows))
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        utils.AI_CACHE_DIR = tmp
+
+        def analyze(backend):
+            utils.submit_negative_margin_analysis(projects, backend).result()
+
+        def concurrent(backend):
+            with ThreadPoolExecutor(CONCURRENT_REQUESTS) as pool:
+                for future in [pool.submit(analyze, backend) for _ in range(CONCURRENT_REQUESTS)]:
+                    future.result()
+
+        def direct(backend):
+            llm.generate("prompt", backend, timeout=latency / 2, retries=1)
+
+        cached = llm.StubBackend(latency=latency, chunk_delay=latency / 10)
+        results.append(_scenario("model call", cached, analyze))
+        results.append(_scenario("cached", cached, analyze))
+        utils.clear_ai_cache()
+        results.append(_scenario(f"{CONCURRENT_REQUESTS} concurrent",
+                                 llm.StubBackend(latency=latency, chunk_delay=latency / 10), concurrent))
+        utils.clear_ai_cache()
+        results.append(_scenario("2 transient failures", llm.StubBackend(latency=latency, fail_first=2), analyze))
+        results.append(_scenario("timeout", llm.StubBackend(latency=latency), direct))
+    return results
+
+
+if __name__ == "__main__":
+    latency = float(sys.argv[1]) if len(sys.argv) > 1 else 0.5
+    print(f"{'scenario':<24}{'seconds':>9}{'backend calls':>15}{'attempts':>10}{'retries':>9}{'timeouts':>10}  outcome")
+    for result in run(latency):
+        print(f"{result['scenario']:<24}{result['seconds']:>9}{result['backend_calls']:>15}{result['attempts']:>10}"
+              f"{result['retries']:>9}{result['timeouts']:>10}  {result['outcome']}")
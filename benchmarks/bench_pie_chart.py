@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+"""
+Benchmark utils.create_pie_chart with and without top-N aggregation as
+the number of distinct names grows.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_pie_chart [distinct names ...]
+
+Reports figure build time, slice count and serialized JSON size.
+"""
+
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+from utils import clear_figure_cache, create_pie_chart
+
+ROWS = 100_000
+
+
+def make_frame(names: int, rows: int = ROWS, seed: int = 0) -> pd.DataFrame:
+    """Per-project revenue spread over ``names`` owners"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Owner': [f"Owner {i}" for i in rng.integers(0, names, rows)],
+        'Revenue': rng.gamma(2.0, 5000.0, rows),
+    })
+
+
+def _measure(df: pd.DataFrame, top_n) -> tuple:
+    """Return (seconds, slices, JSON bytes) for one uncached figure build"""
+    clear_figure_cache()
+    start = time.perf_counter()
+    fig = create_pie_chart(df, 'Revenue', 'Owner', 'Revenue by Owner', top_n=top_n)
+    elapsed = time.perf_counter() - start
+    return elapsed, len(set(fig.data[0].labels)), len(fig.to_json())
+
+
+def run(sizes=(10, 100, 1_000, 10_000)) -> list:
+    """Build the chart both ways at each cardinality; returns one dict per size"""
+    results = []
+    for names in sizes:
+        df = make_frame(names)
+        full_s, full_slices, full_bytes = _measure(df, None)
+        top_s, top_slices, top_bytes = _measure(df, 12)
+        results.append({
+            "names": names,
+            "full_seconds": round(full_s, 4),
+            "full_slices": full_slices,
+            "full_json_bytes": full_bytes,
+            "top_n_seconds": round(top_s, 4),
+            "top_n_slices": top_slices,
+            "top_n_json_bytes": top_bytes,
+        })
+    return results
+
+
+if __name__ == "__main__":
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or (10, 100, 1_000, 10_000)
+    print(f"{'names':>8}{'full s':>9}{'full slices':>13}{'full KiB':>10}{'top-N s':>10}{'top-N slices':>14}{'top-N KiB':>11}")
+    for result in run(sizes):
+        print(f"{result['names']:>8}{result['full_seconds']:>9}{result['full_slices']:>13}{result['full_json_bytes'] // 1024:>10}"
+              f"{result['top_n_seconds']:>10}{result['top_n_slices']:>14}{result['top_n_json_bytes'] // 1024:>11}")
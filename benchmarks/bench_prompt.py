@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""
+Benchmark the AI analysis prompt: the previous prompt (the first 15
+negative margin rows as CSV) against insights.build_negative_margin_prompt.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_prompt [rows ...]
+
+Reports build time, estimated tokens and how many negative margin projects
+each prompt covers.
+"""
+
+import sys
+import time
+import pandas as pd
+
+from benchmarks.synthetic import make_projects
+from data_processor import process_projects
+from insights import build_negative_margin_prompt, estimate_tokens, notes_column
+
+LEGACY_COLUMNS = [
+    'Topic', 'Region', 'Owner', 'Actual Margin %', 'Total Costs Variance $',
+    'Quoted Labor Hours', 'Actual Labor Hours', 'Labor Variance $',
+    'Parts Variance $', 'Calculated Total Install Price $'
+]
+
+
+def legacy_prompt(projects_df: pd.DataFrame) -> str:
+    """The prompt as built before the budgeted builder, for comparison"""
+    negative = projects_df[projects_df['Actual Margin %'] < 0]
+    columns = [col for col in LEGACY_COLUMNS if col in negative.columns]
+    notes = notes_column(negative)
+    if notes:
+        columns.append(notes)
+    return f"""
+        I'm analyzing financial data for projects with negative margins.
+        Here's the data for some representative negative margin projects:
+
+        {negative[columns].head(15).to_csv(index=False)}
+
+        Based on this data, please provide:
+        1. 5-6 bullet points identifying common issues or patterns in these negative margin projects
+        2. 3-4 actionable recommendations for improving profitability on future projects
+        3. A brief analysis of the relationship between quoted vs. actual labor hours in these projects
+
+        Format your response as markdown with clear sections.
+        Focus on practical, data-driven insights that can help improve project performance.
+        """
+
+
+def _time(func, *args) -> tuple:
+    start = time.perf_counter()
+    result = func(*args)
+    return (time.perf_counter() - start) * 1000, result
+
+
+def run(sizes=(1_000, 100_000, 1_000_000)) -> list:
+    """Build both prompts at each size; returns one dict per size"""
+    results = []
+    for rows in sizes:
+        projects = process_projects(make_projects(rows))
+        negative = int((projects['Actual Margin %'] < 0).sum())
+        legacy_ms, legacy = _time(legacy_prompt, projects)
+        budgeted_ms, budgeted = _time(build_negative_margin_prompt, projects)
+        results.append({
+            "rows": rows,
+            "negative": negative,
+            "legacy_ms": round(legacy_ms, 1),
+            "legacy_tokens": estimate_tokens(legacy),
+            "legacy_covered": min(negative, 15),
+            "budgeted_ms": round(budgeted_ms, 1),
+            "budgeted_tokens": estimate_tokens(budgeted),
+            "budgeted_covered": negative,
+        })
+    return results
+
+
+if __name__ == "__main__":
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or (1_000, 100_000, 1_000_000)
+    print(f"{'rows':>9}{'negative':>10}{'legacy ms':>11}{'tokens':>8}{'covered':>9}"
+          f"{'budgeted ms':>13}{'tokens':>8}{'covered':>9}")
+    for result in run(sizes):
+        print(f"{result['rows']:>9}{result['negative']:>10}{result['legacy_ms']:>11}{result['legacy_tokens']:>8}"
+              f"{result['legacy_covered']:>9}{result['budgeted_ms']:>13}{result['budgeted_tokens']:>8}"
+              f"{result['budgeted_covered']:>9}")
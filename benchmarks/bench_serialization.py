@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""
+Benchmark figure serialization: the encoding st.plotly_chart performs
+against utils.figure_to_json and the cached ``to_json`` of a chart helper.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_serialization [rows ...]
+
+Reports milliseconds and JSON size for a full-resolution line chart over
+a datetime axis.
+"""
+
+import sys
+import time
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+
+from utils import clear_figure_cache, create_line_chart, figure_to_json
+
+
+def make_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Daily revenue and cost series shaped like the dashboard's line chart input"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Date': pd.date_range('2020-01-01', periods=rows, freq='min'),
+        'Revenue': rng.normal(0, 1000, rows).cumsum(),
+        'Cost': rng.normal(0, 1000, rows).cumsum(),
+    })
+
+
+def _time(func, *args, **kwargs) -> tuple:
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return (time.perf_counter() - start) * 1000, result
+
+
+def run(sizes=(10_000, 100_000, 500_000)) -> list:
+    """Serialize one line chart per size three ways; returns one dict per size"""
+    results = []
+    for rows in sizes:
+        args = (make_frame(rows), 'Date', ['Revenue', 'Cost'], 'Revenue and Cost')
+        clear_figure_cache()
+        fig = create_line_chart(*args, max_points=None)
+        default_ms, default_json = _time(lambda: pio.to_json(fig.to_dict(), validate=False))
+        fast_ms, fast_json = _time(figure_to_json, fig)
+        create_line_chart.to_json(*args, max_points=None)
+        cached_ms, _ = _time(create_line_chart.to_json, *args, max_points=None)
+        results.append({
+            "rows": rows,
+            "default_ms": round(default_ms, 1),
+            "default_json_bytes": len(default_json),
+            "figure_to_json_ms": round(fast_ms, 1),
+            "figure_to_json_bytes": len(fast_json),
+            "cached_ms": round(cached_ms, 1),
+        })
+    return results
+
+
+if __name__ == "__main__":
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or (10_000, 100_000, 500_000)
+    print(f"{'rows':>8}{'default ms':>12}{'default KiB':>13}{'fast ms':>10}{'fast KiB':>10}{'cached ms':>11}")
+    for result in run(sizes):
+        print(f"{result['rows']:>8}{result['default_ms']:>12}{result['default_json_bytes'] // 1024:>13}"
+              f"{result['figure_to_json_ms']:>10}{result['figure_to_json_bytes'] // 1024:>10}{result['cached_ms']:>11}")
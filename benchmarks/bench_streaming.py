@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""
+Compare peak memory and wall time of the full-load and streaming
+Projects.csv readers.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_streaming [rows] [chunksize]
+
+Writes a synthetic export with the dashboard columns plus unused wide
+text columns to a temporary directory. Peak memory is measured with
+tracemalloc, which tracks numpy and pandas buffers.
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import pandas as pd
+
+from benchmarks.synthetic import write_projects_csv
+from data_processor import STREAMING_CHUNK_ROWS, load_projects_chunked, process_projects
+
+
+def _measure(func, *args) -> tuple:
+    """Return (seconds, peak MiB, rows) for one call"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / (1 << 20), len(result)
+
+
+def run(rows: int = 500_000, chunksize: int = STREAMING_CHUNK_ROWS) -> list:
+    """Time both readers on one synthetic file; returns one dict per mode"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "Projects.csv")
+        write_projects_csv(path, rows)
+        file_mib = os.path.getsize(path) / (1 << 20)
+        modes = [
+            ("full", lambda: process_projects(pd.read_csv(path))),
+            ("streaming", lambda: load_projects_chunked(path, chunksize)),
+        ]
+        results = []
+        for mode, load in modes:
+            seconds, peak_mib, loaded = _measure(load)
+            results.append({
+                "mode": mode,
+                "rows": loaded,
+                "file_mib": round(file_mib, 1),
+                "seconds": round(seconds, 3),
+                "peak_mib": round(peak_mib, 1),
+            })
+    return results
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    chunksize = int(sys.argv[2]) if len(sys.argv) > 2 else STREAMING_CHUNK_ROWS
+    results = run(rows, chunksize)
+    print(f"{'mode':<12}{'rows':>10}{'file MiB':>10}{'seconds':>10}{'peak MiB':>10}")
+    for result in results:
+        print(f"{result['mode']:<12}{result['rows']:>10}{result['file_mib']:>10}{result['seconds']:>10}{result['peak_mib']:>10}")
+    print(f"streaming peak is {results[1]['peak_mib'] / results[0]['peak_mib']:.0%} of full-load peak")
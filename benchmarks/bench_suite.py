@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+"""
+End-to-end benchmark of one dashboard run on synthetic exports: ingest,
+sidebar filters, derived metrics and the chart helpers.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_suite [rows ...] [--output PATH] [--compare BASELINE]
+
+For each dataset size (default 1k to 1M projects) Summary.csv and
+Projects.csv are generated with benchmarks.synthetic. Every stage is timed
+in one pass and memory-profiled with tracemalloc in a second pass, since
+tracing slows down the Python-heavy stages. Results are written as JSON
+(by default to benchmarks/results/<commit>.json); pass ``--compare`` with
+an earlier results file to print the change per stage.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Tuple
+import numpy as np
+import pandas as pd
+import plotly
+
+from benchmarks.synthetic import write_dataset
+from data_processor import (DEFAULT_METRICS, clear_cache, get_filter_engine, get_rollup_cube,
+                            load_and_process_data, sidecar_path, with_metrics)
+from utils import clear_figure_cache, create_bar_chart, create_line_chart, create_pie_chart
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+# Sidebar selection applied by the filter stages
+REGION = 'West'
+DATE_RANGE = (pd.Timestamp('2022-01-01'), pd.Timestamp('2022-12-31'))
+LINE_COLUMNS = ['Actual Margin %', 'Estimated Margin %']
+
+
+def _ingest_cold(state: Dict[str, Any]) -> None:
+    clear_cache()
+    shutil.rmtree(os.path.dirname(sidecar_path(state['projects_path'])), ignore_errors=True)
+    state['summary'], state['projects'] = load_and_process_data(state['summary_path'], state['projects_path'])
+
+
+def _ingest_sidecar(state: Dict[str, Any]) -> None:
+    clear_cache()
+    state['summary'], state['projects'] = load_and_process_data(state['summary_path'], state['projects_path'])
+
+
+def _ingest_cached(state: Dict[str, Any]) -> None:
+    state['summary'], state['projects'] = load_and_process_data(state['summary_path'], state['projects_path'])
+
+
+def _filter_regions(state: Dict[str, Any]) -> None:
+    state['regions'] = get_filter_engine(state['projects']).regions(DATE_RANGE)
+
+
+def _filter_view(state: Dict[str, Any]) -> None:
+    state['view'] = get_filter_engine(state['projects']).view(REGION, DATE_RANGE)
+
+
+def _metrics(state: Dict[str, Any]) -> None:
+    state['view'] = with_metrics(state['view'], DEFAULT_METRICS)
+
+
+def _rollup(state: Dict[str, Any]) -> None:
+    state['owners'] = get_rollup_cube(state['projects']).summarize(
+        by=('Owner',), regions=[REGION], start=DATE_RANGE[0], end=DATE_RANGE[1])
+
+
+def _bar_chart(state: Dict[str, Any]) -> None:
+    clear_figure_cache()
+    create_bar_chart(state['owners'], 'Owner', 'Total Costs Variance $', 'Cost Variance by Owner')
+
+
+def _line_chart(state: Dict[str, Any]) -> None:
+    create_line_chart(state['view'], 'Projected End Date', LINE_COLUMNS, 'Margins')
+
+
+def _pie_chart(state: Dict[str, Any]) -> None:
+    create_pie_chart(state['view'], 'Calculated Total Install Price $', 'Owner', 'Revenue by Owner')
+
+
+def _chart_json(state: Dict[str, Any]) -> None:
+    create_line_chart.to_json(state['view'], 'Projected End Date', LINE_COLUMNS, 'Margins')
+
+
+# One dashboard run, in order; later stages use the state earlier ones set.
+# Stages named "(cached)" repeat the previous call to time the warm path.
+STAGES: List[Tuple[str, Callable[[Dict[str, Any]], None]]] = [
+    ("ingest (cold)", _ingest_cold),
+    ("ingest (sidecar)", _ingest_sidecar),
+    ("ingest (cached)", _ingest_cached),
+    ("filter regions", _filter_regions),
+    ("filter view", _filter_view),
+    ("filter view (cached)", _filter_view),
+    ("metrics", _metrics),
+    ("rollup", _rollup),
+    ("bar chart", _bar_chart),
+    ("line chart", _line_chart),
+    ("line chart (cached)", _line_chart),
+    ("pie chart", _pie_chart),
+    ("chart json", _chart_json),
+]
+
+
+def _timed_pass(state: Dict[str, Any]) -> Dict[str, float]:
+    seconds = {}
+    for name, stage in STAGES:
+        start = time.perf_counter()
+        stage(state)
+        seconds[name] = time.perf_counter() - start
+    return seconds
+
+
+def _traced_pass(state: Dict[str, Any]) -> Dict[str, Tuple[float, float]]:
+    """Peak and retained MiB allocated by each stage, beyond what was live before it"""
+    memory = {}
+    tracemalloc.start()
+    try:
+        for name, stage in STAGES:
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            stage(state)
+            after, peak = tracemalloc.get_traced_memory()
+            memory[name] = ((peak - before) / (1 << 20), (after - before) / (1 << 20))
+    finally:
+        tracemalloc.stop()
+    return memory
+
+
+def run(sizes=DEFAULT_SIZES, seed: int = 0) -> list:
+    """Run every stage at each dataset size; returns one dict per size and stage"""
+    results = []
+    # One small run first, so one-time imports and Plotly setup are not
+    # charged to the first size
+    with tempfile.TemporaryDirectory() as tmp:
+        summary_path, projects_path = write_dataset(tmp, 100, seed)
+        _timed_pass({'summary_path': summary_path, 'projects_path': projects_path})
+    for rows in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            summary_path, projects_path = write_dataset(tmp, rows, seed)
+            file_mib = os.path.getsize(projects_path) / (1 << 20)
+            state = {'summary_path': summary_path, 'projects_path': projects_path}
+            seconds = _timed_pass(state)
+            memory = _traced_pass(state)
+            clear_cache()
+            clear_figure_cache()
+        for name, _ in STAGES:
+            peak_mib, retained_mib = memory[name]
+            results.append({
+                "rows": rows,
+                "stage": name,
+                "file_mib": round(file_mib, 2),
+                "seconds": round(seconds[name], 5),
+                "peak_mib": round(peak_mib, 2),
+                "retained_mib": round(retained_mib, 2),
+            })
+    return results
+
+
+def _commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def write_results(results: list, path: str) -> Dict[str, Any]:
+    """Write results with the commit and library versions they were measured on"""
+    report = {
+        "commit": _commit(),
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "versions": {"pandas": pd.__version__, "numpy": np.__version__, "plotly": plotly.__version__},
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+    return report
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any]) -> list:
+    """Ratio of current to baseline seconds and peak memory per (rows, stage)"""
+    previous = {(r["rows"], r["stage"]): r for r in baseline["results"]}
+    changes = []
+    for result in current["results"]:
+        before = previous.get((result["rows"], result["stage"]))
+        if before is None:
+            continue
+        changes.append({
+            "rows": result["rows"],
+            "stage": result["stage"],
+            "seconds_ratio": round(result["seconds"] / before["seconds"], 2) if before["seconds"] else None,
+            "peak_ratio": round(result["peak_mib"] / before["peak_mib"], 2) if before["peak_mib"] > 0 else None,
+        })
+    return changes
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("sizes", nargs="*", type=int, default=list(DEFAULT_SIZES))
+    parser.add_argument("--output", help="results file (default: benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", metavar="BASELINE", help="earlier results file to compare against")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.seed)
+    output = args.output or os.path.join(RESULTS_DIR, f"{_commit()}.json")
+    report = write_results(results, output)
+
+    print(f"{'rows':>9}  {'stage':<22}{'seconds':>10}{'peak MiB':>10}{'kept MiB':>10}")
+    for result in results:
+        print(f"{result['rows']:>9}  {result['stage']:<22}{result['seconds']:>10.4f}"
+              f"{result['peak_mib']:>10.1f}{result['retained_mib']:>10.1f}")
+    print(f"results written to {output}", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print(f"\nchange against {baseline['commit']} (ratio, <1 is better)")
+        print(f"{'rows':>9}  {'stage':<22}{'seconds':>10}{'peak':>10}")
+        for change in compare(baseline, report):
+            print(f"{change['rows']:>9}  {change['stage']:<22}{str(change['seconds_ratio']):>10}{str(change['peak_ratio']):>10}")
@@ -0,0 +1,99 @@
+"""
+Synthetic Summary.csv / Projects.csv exports for the benchmarks.
+
+Values are written the way the real exports format them: money as
+"$1,234.56" with accounting negatives "($1,234.56)", percentages as
+"12.5%" and dates as MM/DD/YYYY, so the loader's parsing is exercised.
+"""
+
+import os
+from typing import List, Tuple
+import numpy as np
+import pandas as pd
+
+REGIONS = ('Northeast', 'Southeast', 'Central', 'West')
+OWNERS = tuple(f"Owner {i}" for i in range(40))
+NOTES = (
+    'Scope added after award', 'Labor overrun on install', 'Parts backordered',
+    'Customer delayed access', 'Completed as quoted', '',
+)
+# Columns present in real exports that no dashboard view reads
+UNUSED_COLUMNS = ('Customer Address', 'Site Contact', 'Internal Comments', 'PO Number')
+FIRST_END_DATE = pd.Timestamp("2020-01-01")
+END_DATE_SPAN_DAYS = 1500
+
+
+def money_strings(values: np.ndarray) -> List[str]:
+    """Format amounts like the exports: "$1,234.56" and "($1,234.56)" """
+    return [f"${value:,.2f}" if value >= 0 else f"(${-value:,.2f})" for value in values.tolist()]
+
+
+def percent_strings(values: np.ndarray) -> np.ndarray:
+    """Format percentages like the exports: "12.5%" """
+    return np.char.add(np.char.mod("%.1f", values), "%")
+
+
+def make_projects(rows: int, seed: int = 0, unused_columns: bool = False) -> pd.DataFrame:
+    """Build a raw Projects.csv frame with ``rows`` projects"""
+    rng = np.random.default_rng(seed)
+    quoted = rng.integers(10, 400, rows)
+    frame = pd.DataFrame({
+        'Topic': np.char.add("Project ", np.arange(rows).astype(str)),
+        'Region': rng.choice(REGIONS, rows),
+        'Owner': rng.choice(OWNERS, rows),
+        'Calculated Total Install Price $': money_strings(rng.uniform(1e3, 5e5, rows)),
+        'Total Costs Variance $': money_strings(rng.normal(0, 5000, rows)),
+        'Labor Variance $': money_strings(rng.normal(0, 3000, rows)),
+        'Parts Variance $': money_strings(rng.normal(0, 2000, rows)),
+        'Estimated Margin %': percent_strings(rng.normal(25, 5, rows)),
+        'Actual Margin %': percent_strings(rng.normal(20, 15, rows)),
+        'Quoted Labor Hours': quoted,
+        'Actual Labor Hours': quoted + rng.integers(-20, 80, rows),
+        'Projected End Date': (FIRST_END_DATE
+                               + pd.to_timedelta(rng.integers(0, END_DATE_SPAN_DAYS, rows), unit="D")).strftime("%m/%d/%Y"),
+        'Project Notes': rng.choice(NOTES, rows),
+    })
+    if unused_columns:
+        for column in UNUSED_COLUMNS:
+            frame[column] = "x" * 60
+    return frame
+
+
+def make_summary(projects: pd.DataFrame) -> pd.DataFrame:
+    """Build the per-region Summary.csv frame matching a raw projects frame"""
+    def amounts(column: str) -> pd.Series:
+        text = projects[column].str.replace(r"[$,)]", "", regex=True).str.replace("(", "-", regex=False)
+        return pd.to_numeric(text)
+
+    margins = pd.to_numeric(projects['Actual Margin %'].str.rstrip('%'))
+    grouped = pd.DataFrame({
+        'Region': projects['Region'],
+        'Install Price': amounts('Calculated Total Install Price $'),
+        'Costs Variance': amounts('Total Costs Variance $'),
+        'Margin': margins,
+    }).groupby('Region', sort=True)
+    totals = grouped.agg(count=('Margin', 'size'), price=('Install Price', 'sum'),
+                         variance=('Costs Variance', 'sum'), margin=('Margin', 'mean'))
+    return pd.DataFrame({
+        'Region': totals.index,
+        'Project Count': totals['count'].to_numpy(),
+        'Total Install Price $': money_strings(totals['price'].to_numpy()),
+        'Total Costs Variance $': money_strings(totals['variance'].to_numpy()),
+        'Average Actual Margin %': percent_strings(totals['margin'].to_numpy()),
+    })
+
+
+def write_projects_csv(path: str, rows: int, seed: int = 0, unused_columns: bool = True) -> None:
+    """Write a synthetic Projects.csv shaped like the real export"""
+    make_projects(rows, seed, unused_columns).to_csv(path, index=False)
+
+
+def write_dataset(directory: str, rows: int, seed: int = 0,
+                  unused_columns: bool = False) -> Tuple[str, str]:
+    """Write Summary.csv and Projects.csv into ``directory``; returns their paths"""
+    summary_path = os.path.join(directory, "Summary.csv")
+    projects_path = os.path.join(directory, "Projects.csv")
+    projects = make_projects(rows, seed, unused_columns)
+    make_summary(projects).to_csv(summary_path, index=False)
+    projects.to_csv(projects_path, index=False)
+    return summary_path, projects_path
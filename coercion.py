@@ -0,0 +1,152 @@
+"""
+Vectorized coercion of money, percent and date strings, shared by the
+loader (data_processor) and the chart helpers (utils).
+"""
+
+import threading
+import weakref
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, Tuple
+
+# Column kinds understood by the cleaning engine
+MONEY = "money"
+PERCENT = "percent"
+DATE = "date"
+
+# Byte-level translation applied to a whole column at once: '(' becomes a
+# minus sign so accounting negatives like "(1,234.00)" parse, and currency
+# symbols, thousands separators, spaces and ')' are dropped
+_OPEN_PAREN_TO_MINUS = bytes.maketrans(b"(", b"-")
+_DELETE_BYTES = {
+    MONEY: b"$, )",
+    PERCENT: b"%$, )",
+}
+_CELL_SEPARATOR = "\x00"
+
+# coerce_column results for text columns, keyed by (id(frame), column,
+# kind) and dropped when the frame is garbage collected
+_coerce_lock = threading.Lock()
+_coerced: Dict[Tuple[int, str, Optional[str]], np.ndarray] = {}
+_coerce_stats = {"hits": 0, "misses": 0, "passthrough": 0}
+
+
+def needs_cleaning(series: pd.Series) -> bool:
+    """Only text columns are cleaned; numeric/date columns pass through"""
+    return series.dtype == object or pd.api.types.is_string_dtype(series.dtype)
+
+
+def parse_numeric_strings(values: np.ndarray, kind: Optional[str] = None) -> np.ndarray:
+    """
+    Parse an array of money/percent strings to float64 in a single pass.
+    
+    All cells are joined into one buffer, translated with one
+    ``bytes.translate`` call and converted with numpy's C float parser.
+    Blank or malformed cells fall back to pandas' coercing parser (NaN).
+    Percent values are returned as fractions; with ``kind`` None a column
+    is treated as percent if any cell contains '%'.
+    """
+    out = np.full(len(values), np.nan)
+    present = pd.notna(values)
+    strings = values[present]
+    if len(strings) == 0:
+        return out
+    try:
+        buffer = _CELL_SEPARATOR.join(strings)
+    except TypeError:
+        # Mixed object column (e.g. ints alongside strings)
+        buffer = _CELL_SEPARATOR.join(strings.astype(str))
+    buffer = buffer.encode("utf-8")
+    if kind is None:
+        kind = PERCENT if b"%" in buffer else MONEY
+    cells = buffer.translate(_OPEN_PAREN_TO_MINUS, _DELETE_BYTES[kind]).split(_CELL_SEPARATOR.encode())
+    try:
+        parsed = np.array(cells).astype(np.float64)
+    except ValueError:
+        parsed = pd.to_numeric(pd.Series(cells).str.decode("utf-8"), errors='coerce').to_numpy(dtype=np.float64)
+    if kind == PERCENT:
+        parsed = parsed / 100
+    out[present] = parsed
+    return out
+
+
+def parse_date_strings(values: np.ndarray, date_format: Optional[str] = None) -> np.ndarray:
+    """Parse an array of date strings, converting each distinct value once"""
+    # Exports repeat the same dates many times
+    codes, uniques = pd.factorize(values)
+    parsed = pd.to_datetime(pd.Series(uniques, dtype=object), errors='coerce', format=date_format).to_numpy()
+    result = parsed.take(codes) if len(parsed) else np.full(len(values), np.datetime64('NaT'), dtype='datetime64[ns]')
+    result[codes < 0] = np.datetime64('NaT')
+    return result
+
+
+def clean_column(series: pd.Series, kind: str, date_format: Optional[str] = None) -> pd.Series:
+    """
+    Convert one raw CSV column according to its schema kind. Columns read
+    as numbers (e.g. entirely blank ones) are cast too, so every chunk of
+    a file gets the same dtype: datetime64 for dates, float64 otherwise.
+    """
+    if not needs_cleaning(series):
+        if kind != DATE:
+            return series.astype(np.float64)
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            return series
+        # Numeric dates such as 20240131 are parsed from their text
+        values = series.to_numpy(dtype=object)
+        present = pd.notna(values)
+        numbers = series[present]
+        if pd.api.types.is_float_dtype(numbers.dtype) and (numbers % 1 == 0).all():
+            numbers = numbers.astype(np.int64)
+        values[present] = numbers.astype(str).to_numpy(dtype=object)
+        values[~present] = None
+        return pd.Series(parse_date_strings(values, date_format), index=series.index, name=series.name)
+    values = series.to_numpy(dtype=object)
+    if kind == DATE:
+        return pd.Series(parse_date_strings(values, date_format), index=series.index, name=series.name)
+    return pd.Series(parse_numeric_strings(values, kind), index=series.index, name=series.name)
+
+
+def coerce_numeric(series: pd.Series, kind: Optional[str] = None) -> pd.Series:
+    """
+    Return ``series`` as numbers for plotting or arithmetic. Numeric
+    columns are returned unchanged without a scan; text columns are
+    parsed in one pass with parse_numeric_strings.
+    """
+    if not needs_cleaning(series):
+        return series
+    return pd.Series(parse_numeric_strings(series.to_numpy(dtype=object), kind),
+                     index=series.index, name=series.name)
+
+
+def coerce_column(df: pd.DataFrame, column: str, kind: Optional[str] = None) -> pd.Series:
+    """
+    coerce_numeric for ``df[column]``, parsing a text column at most once
+    per frame. Frames are treated as read-only, so the parsed values are
+    reused for as long as ``df`` is alive.
+    """
+    series = df[column]
+    if not needs_cleaning(series):
+        with _coerce_lock:
+            _coerce_stats["passthrough"] += 1
+        return series
+    key = (id(df), column, kind)
+    with _coerce_lock:
+        parsed = _coerced.get(key)
+        if parsed is not None:
+            _coerce_stats["hits"] += 1
+            return pd.Series(parsed, index=series.index, name=series.name)
+        _coerce_stats["misses"] += 1
+    parsed = coerce_numeric(series, kind).to_numpy()
+    # Shared between callers, so make accidental in-place edits fail loudly
+    parsed.flags.writeable = False
+    with _coerce_lock:
+        if key not in _coerced:
+            weakref.finalize(df, _coerced.pop, key, None)
+        _coerced[key] = parsed
+    return pd.Series(parsed, index=series.index, name=series.name)
+
+
+def get_coerce_stats() -> Dict[str, int]:
+    """Return coerce_column cache hits, misses and numeric pass-throughs"""
+    with _coerce_lock:
+        return dict(_coerce_stats, entries=len(_coerced))
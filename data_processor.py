@@ -1,60 +1,939 @@
+import functools
+import hashlib
+import io
+import os
+import threading
+import weakref
 import pandas as pd
 import numpy as np
-from typing import Tuple
+from collections import OrderedDict
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 
-def load_and_process_data() -> Tuple[pd.DataFrame, pd.DataFrame]:
+from coercion import DATE, MONEY, PERCENT, clean_column
+
+try:
+    import pyarrow as pa
+except ImportError:  # The sidecar cache is skipped without pyarrow
+    pa = None
+
+SUMMARY_PATH = os.path.join("attached_assets", "Summary.csv")
+PROJECTS_PATH = os.path.join("attached_assets", "Projects.csv")
+
+# Read files in 1 MiB blocks when hashing so large exports don't spike memory
+_HASH_BLOCK_SIZE = 1 << 20
+
+# Fingerprint = (path, size, mtime_ns, content hash)
+Fingerprint = Tuple[str, int, int, str]
+# ProcessedPrefix = (source size, source content hash, processed frame)
+ProcessedPrefix = Tuple[int, str, pd.DataFrame]
+
+_cache_lock = threading.Lock()
+_load_cache: Dict[Tuple[str, str, bool], Tuple[Tuple[Fingerprint, Fingerprint], Tuple[pd.DataFrame, pd.DataFrame]]] = {}
+_cache_stats = {"hits": 0, "misses": 0, "rehashes": 0, "appends": 0}
+
+
+def _hash_file(path: str, limit: Optional[int] = None) -> str:
+    """Return the blake2b hex digest of a file's contents, or of its first ``limit`` bytes"""
+    digest = hashlib.blake2b(digest_size=16)
+    remaining = limit
+    with open(path, "rb") as f:
+        while remaining is None or remaining > 0:
+            block = f.read(_HASH_BLOCK_SIZE if remaining is None else min(_HASH_BLOCK_SIZE, remaining))
+            if not block:
+                break
+            digest.update(block)
+            if remaining is not None:
+                remaining -= len(block)
+    return digest.hexdigest()
+
+
+def file_fingerprint(path: str, previous: Optional[Fingerprint] = None) -> Fingerprint:
+    """
+    Fingerprint a file by path, size, mtime and content hash.
+    
+    The content hash is only recomputed when size or mtime differ from
+    ``previous``, so an unchanged file costs a single ``os.stat`` call.
+    """
+    st = os.stat(path)
+    if previous is not None and previous[:3] == (path, st.st_size, st.st_mtime_ns):
+        return previous
+    _cache_stats["rehashes"] += 1
+    return (path, st.st_size, st.st_mtime_ns, _hash_file(path))
+
+
+def _same_content(a: Optional[Fingerprint], b: Fingerprint) -> bool:
+    """True if two fingerprints describe the same file contents"""
+    return a is not None and a[0] == b[0] and a[1] == b[1] and a[3] == b[3]
+
+
+def get_cache_stats() -> Dict[str, int]:
+    """Return a snapshot of the loader cache hit/miss counters"""
+    with _cache_lock:
+        return dict(_cache_stats, entries=len(_load_cache))
+
+
+def clear_cache() -> None:
+    """Drop all cached frames and reset the hit/miss counters"""
+    with _cache_lock:
+        _load_cache.clear()
+        for key in _cache_stats:
+            _cache_stats[key] = 0
+
+
+# Declarative schema for the known Projects.csv columns
+PROJECT_COLUMN_SCHEMA: Dict[str, str] = {
+    'Calculated Total Install Price $': MONEY,
+    'Total Costs Variance $': MONEY,
+    'Labor Variance $': MONEY,
+    'Parts Variance $': MONEY,
+    'Estimated Margin %': PERCENT,
+    'Actual Margin %': PERCENT,
+    'Projected End Date': DATE,
+}
+
+# Fallback rules for columns not in the schema, checked in order.
+# Percent comes first so that e.g. 'Actual Margin %' isn't parsed as money.
+COLUMN_KIND_RULES: List[Tuple[str, Tuple[str, ...]]] = [
+    (PERCENT, ('%',)),
+    (DATE, ('Date',)),
+    (MONEY, ('Price', 'Cost', 'Margin', 'Revenue', 'Variance')),
+]
+
+# Optional explicit date formats; columns not listed let pandas infer one
+DATE_FORMATS: Dict[str, str] = {}
+
+def resolve_column_kind(column: str, schema: Optional[Dict[str, str]] = None) -> Optional[str]:
+    """Return the cleaning kind for a column, or None if it is left as-is"""
+    schema = PROJECT_COLUMN_SCHEMA if schema is None else schema
+    if column in schema:
+        return schema[column]
+    for kind, patterns in COLUMN_KIND_RULES:
+        if any(pattern in column for pattern in patterns):
+            return kind
+    return None
+
+
+@functools.lru_cache(maxsize=32)
+def compile_cleaner(columns: Tuple[str, ...]) -> Tuple[Tuple[str, str], ...]:
+    """
+    Resolve the schema for a set of columns once and return the
+    (column, kind) plan that clean_frame executes.
+    """
+    plan = []
+    for column in columns:
+        kind = resolve_column_kind(column)
+        if kind is not None:
+            plan.append((column, kind))
+    return tuple(plan)
+
+
+def clean_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Clean every schema column of ``df`` in place and return it"""
+    for column, kind in compile_cleaner(tuple(df.columns)):
+        df[column] = clean_column(df[column], kind, DATE_FORMATS.get(column))
+    return df
+
+
+def _is_lossless(values: np.ndarray, dtype: np.dtype) -> bool:
+    """True if ``values`` survive a round trip through ``dtype`` unchanged"""
+    with np.errstate(over='ignore', invalid='ignore'):
+        narrowed = values.astype(dtype)
+    return np.array_equal(narrowed.astype(values.dtype), values, equal_nan=True)
+
+
+def compact_column(series: pd.Series) -> pd.Series:
+    """
+    Return ``series`` in the smallest dtype that holds its values exactly:
+    int64/float64 become int32/float32 only when no value changes.
+    Integers stop at int32 so arithmetic in the views can't silently wrap
+    around. Text stays as it is: pages group and fill Region, Owner and
+    the notes with pandas' defaults, which categoricals would change.
+    """
+    if series.dtype == np.int64 and _is_lossless(series.to_numpy(), np.int32):
+        return series.astype(np.int32)
+    if series.dtype == np.float64 and _is_lossless(series.to_numpy(), np.float32):
+        return series.astype(np.float32)
+    return series
+
+
+def compact_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Compact every column of ``df`` in place and return it"""
+    for column in df.columns:
+        compacted = compact_column(df[column])
+        if compacted is not df[column]:
+            df[column] = compacted
+    return df
+
+
+def concat_frames(parts: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate compacted frames, keeping each column's dtype where the
+    parts agree. The input frames are not modified.
+    
+    A part whose column is entirely blank (a chunk or append with no
+    notes, say) carries no dtype information, so it takes the dtype of
+    the parts that have values instead of degrading the column.
+    """
+    parts = [part.copy(deep=False) for part in parts]
+    columns = dict.fromkeys(column for part in parts for column in part.columns)
+    for column in columns:
+        present = [part for part in parts if column in part.columns]
+        filled = [part[column] for part in present if part[column].notna().any()]
+        if not filled:
+            continue
+        dtype = filled[0].dtype
+        if all(c.dtype == dtype for c in filled):
+            for part in present:
+                if part[column].dtype != dtype and part[column].isna().all():
+                    if pd.api.types.is_integer_dtype(dtype):
+                        part[column] = part[column].astype(np.float64)
+                    else:
+                        part[column] = part[column].astype(dtype)
+    result = pd.concat(parts, ignore_index=True)
+    # Mixed integer and float parts (blank cells in an int column) widen
+    # to float64; compact them again as a single load would
+    for column in columns:
+        if (pd.api.types.is_float_dtype(result[column].dtype)
+                and any(part[column].dtype != result[column].dtype for part in parts if column in part.columns)):
+            result[column] = compact_column(result[column])
+    return result
+
+
+def memory_report(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Per-column memory usage of ``df``, largest first, with the dtype,
+    bytes (including string contents) and share of the frame total.
+    """
+    usage = df.memory_usage(index=False, deep=True)
+    report = pd.DataFrame({
+        'dtype': df.dtypes.astype(str),
+        'bytes': usage,
+        'share': usage / usage.sum() if usage.sum() else 0.0,
+    })
+    return report.sort_values('bytes', ascending=False)
+
+
+# Processed frames are written to an uncompressed Arrow IPC (Feather v2)
+# sidecar so later loads can memory-map them instead of parsing the CSV.
+SIDECAR_DIR_NAME = ".cache"
+SIDECAR_SUFFIX = ".arrow"
+# Bump whenever process_summary/process_projects change their output
+SIDECAR_VERSION = "5"
+_SIDECAR_HASH_KEY = b"profit_pulse.source_hash"
+_SIDECAR_VERSION_KEY = b"profit_pulse.sidecar_version"
+_SIDECAR_SIZE_KEY = b"profit_pulse.source_size"
+_sidecar_stats = {"reads": 0, "writes": 0, "stale": 0}
+
+
+def sidecar_path(csv_path: str, variant: str = "") -> str:
+    """Return the sidecar location for a source CSV and load variant"""
+    directory, name = os.path.split(csv_path)
+    if variant:
+        name = f"{name}.{variant}"
+    return os.path.join(directory, SIDECAR_DIR_NAME, name + SIDECAR_SUFFIX)
+
+
+def get_sidecar_stats() -> Dict[str, int]:
+    """Return counters for sidecar reads, writes and stale sidecars found"""
+    return dict(_sidecar_stats)
+
+
+def _read_sidecar(csv_path: str, source_hash: Optional[str],
+                  variant: str = "") -> Optional[Tuple[Dict[bytes, bytes], pd.DataFrame]]:
+    """Memory-map a sidecar and return its metadata and frame; any source hash matches if None"""
+    path = sidecar_path(csv_path, variant)
+    if pa is None or not os.path.exists(path):
+        return None
+    try:
+        with pa.memory_map(path, "r") as source:
+            reader = pa.ipc.open_file(source)
+            metadata = reader.schema.metadata or {}
+            if ((source_hash is not None and metadata.get(_SIDECAR_HASH_KEY) != source_hash.encode())
+                    or metadata.get(_SIDECAR_VERSION_KEY) != SIDECAR_VERSION.encode()):
+                _sidecar_stats["stale"] += 1
+                return None
+            df = reader.read_all().to_pandas()
+    except (OSError, pa.ArrowException) as e:
+        print(f"Ignoring unreadable sidecar {path}: {e}")
+        return None
+    _sidecar_stats["reads"] += 1
+    return metadata, df
+
+
+def read_sidecar(csv_path: str, source_hash: str, variant: str = "") -> Optional[pd.DataFrame]:
+    """
+    Memory-map the sidecar for ``csv_path`` and return its frame, or None
+    if it is missing, unreadable or was built from different CSV contents.
+    """
+    sidecar = _read_sidecar(csv_path, source_hash, variant)
+    return sidecar[1] if sidecar else None
+
+
+def read_sidecar_prefix(csv_path: str, variant: str = "") -> Optional[ProcessedPrefix]:
+    """
+    Return the sidecar for ``csv_path`` as a ProcessedPrefix whatever CSV
+    contents it was built from, so a grown CSV can be appended to it.
+    """
+    sidecar = _read_sidecar(csv_path, None, variant)
+    if sidecar is None or _SIDECAR_SIZE_KEY not in sidecar[0]:
+        return None
+    metadata, df = sidecar
+    return int(metadata[_SIDECAR_SIZE_KEY]), metadata[_SIDECAR_HASH_KEY].decode(), df
+
+
+def write_sidecar(csv_path: str, source_hash: str, df: pd.DataFrame, variant: str = "",
+                  source_size: Optional[int] = None) -> bool:
+    """
+    Atomically write ``df`` as the sidecar for ``csv_path``, tagged with the
+    source content hash and size. Returns False if the frame or directory
+    can't be written.
+    """
+    if pa is None:
+        return False
+    path = sidecar_path(csv_path, variant)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[_SIDECAR_HASH_KEY] = source_hash.encode()
+        metadata[_SIDECAR_VERSION_KEY] = SIDECAR_VERSION.encode()
+        if source_size is not None:
+            metadata[_SIDECAR_SIZE_KEY] = str(source_size).encode()
+        table = table.replace_schema_metadata(metadata)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with pa.OSFile(tmp_path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+    except (OSError, pa.ArrowException) as e:
+        print(f"Could not write sidecar {path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+    _sidecar_stats["writes"] += 1
+    return True
+
+
+def _load_with_sidecar(csv_path: str, fingerprint: Optional[Fingerprint],
+                       load: Callable[[str], pd.DataFrame], variant: str = "",
+                       append: Optional[Callable[[str, ProcessedPrefix, int], pd.DataFrame]] = None,
+                       previous: Optional[ProcessedPrefix] = None) -> pd.DataFrame:
+    """
+    Load one processed frame from its sidecar, or run ``load`` on the CSV
+    and refresh the sidecar.
+    
+    With ``append``, a CSV that only grew since ``previous`` (or the last
+    sidecar) was built is extended by processing just the new rows.
+    """
+    if fingerprint is not None:
+        df = read_sidecar(csv_path, fingerprint[3], variant)
+        if df is not None:
+            return df
+    df = None
+    if append is not None and fingerprint is not None:
+        base = previous or read_sidecar_prefix(csv_path, variant)
+        if base is not None and is_append(csv_path, base[0], base[1], fingerprint[1]):
+            df = append(csv_path, base, fingerprint[1])
+    if df is None:
+        df = load(csv_path)
+    if fingerprint is not None:
+        write_sidecar(csv_path, fingerprint[3], df, variant, fingerprint[1])
+    return df
+
+
+# Streaming ingest: Projects.csv exports above this size are read in
+# bounded chunks, keeping only the columns the dashboard views use
+STREAMING_THRESHOLD_BYTES = 256 << 20
+STREAMING_CHUNK_ROWS = 100_000
+STREAMING_VARIANT = "stream"
+
+# Projects.csv columns read by the views besides the schema columns
+DASHBOARD_COLUMNS = (
+    'Topic', 'Region', 'Owner', 'Quoted Labor Hours', 'Actual Labor Hours',
+)
+# Free-text columns are matched by name, as the AI analysis does
+DASHBOARD_COLUMN_PATTERNS = ('Notes', 'Performance')
+
+
+def is_dashboard_column(column: str) -> bool:
+    """True if a raw Projects.csv column is kept by the streaming loader"""
+    column = column.strip()
+    return (column in DASHBOARD_COLUMNS
+            or resolve_column_kind(column) is not None
+            or any(pattern in column for pattern in DASHBOARD_COLUMN_PATTERNS))
+
+
+def use_streaming(projects_path: str, chunksize: Optional[int] = None) -> bool:
+    """Decide whether Projects.csv should be loaded with the streaming reader"""
+    if chunksize is not None:
+        return chunksize > 0
+    try:
+        return os.path.getsize(projects_path) > STREAMING_THRESHOLD_BYTES
+    except OSError:
+        return False
+
+
+def load_projects_chunked(projects_path: str, chunksize: int = STREAMING_CHUNK_ROWS) -> pd.DataFrame:
+    """
+    Load Projects.csv ``chunksize`` rows at a time, cleaning each chunk with
+    process_projects as it is read.
+    
+    Only dashboard columns are parsed and blank rows are dropped, so peak
+    memory is the reduced result plus one raw chunk rather than the whole
+    export.
+    """
+    parts = _process_chunks(projects_path, chunksize)
+    if not parts:
+        return process_projects(pd.read_csv(projects_path, usecols=is_dashboard_column, nrows=0))
+    return concat_frames(parts)
+
+
+def _process_chunks(source, chunksize: int, **read_kwargs) -> List[pd.DataFrame]:
+    """Read ``source`` in chunks of dashboard columns and process each non-blank chunk"""
+    parts = []
+    with pd.read_csv(source, usecols=is_dashboard_column, chunksize=chunksize, **read_kwargs) as reader:
+        for chunk in reader:
+            chunk = chunk.dropna(how='all')
+            if not chunk.empty:
+                parts.append(process_projects(chunk))
+    return parts
+
+
+# Incremental ingest: when Projects.csv has only had rows appended since
+# it was last processed, only the bytes after the processed prefix are parsed
+
+def is_append(csv_path: str, size: int, content_hash: str, end: int) -> bool:
+    """
+    True if the first ``end`` bytes of ``csv_path`` are the ``size``-byte
+    file hashed as ``content_hash`` followed by complete new rows.
+    """
+    if not 0 < size < end:
+        return False
+    try:
+        with open(csv_path, "rb") as f:
+            f.seek(size - 1)
+            if f.read(1) != b"\n":
+                return False
+            f.seek(end - 1)
+            if f.read(1) != b"\n":
+                return False
+        return _hash_file(csv_path, size) == content_hash
+    except OSError:
+        return False
+
+
+def append_projects(projects_path: str, base: ProcessedPrefix, end: int,
+                    chunksize: Optional[int] = None) -> pd.DataFrame:
+    """
+    Process the Projects.csv rows between the end of ``base`` and byte
+    ``end`` and return the base frame with them appended. Streaming-mode
+    bases (``chunksize`` set) read the new rows in chunks.
+    """
+    size, _, base_df = base
+    header = pd.read_csv(projects_path, nrows=0).columns
+    with open(projects_path, "rb") as f:
+        f.seek(size)
+        new_rows = io.BytesIO(f.read(end - size))
+    if chunksize:
+        parts = _process_chunks(new_rows, chunksize, header=None, names=header)
+    else:
+        try:
+            parts = [process_projects(pd.read_csv(new_rows, header=None, names=header))]
+        except pd.errors.EmptyDataError:
+            parts = []
+    _cache_stats["appends"] += 1
+    return concat_frames([base_df] + [_match_dtypes(part, base_df) for part in parts]) if parts else base_df
+
+
+def _match_dtypes(part: pd.DataFrame, base: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cast appended rows to the base frame's dtypes where the few new rows
+    alone chose differently, e.g. dates at another resolution. Numbers are
+    widened by concat_frames instead, so no values are lost.
+    """
+    for column in part.columns.intersection(base.columns):
+        dtype = base[column].dtype
+        if part[column].dtype == dtype or pd.api.types.is_numeric_dtype(dtype):
+            continue
+        part[column] = part[column].astype(dtype)
+    return part
+
+
+def load_and_process_data(summary_path: str = SUMMARY_PATH,
+                          projects_path: str = PROJECTS_PATH,
+                          chunksize: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Load and process the dataset files for the dashboard, reusing the
+    already-processed frames while neither source file has changed.
+    
+    The returned frames are shared between reruns and sessions and must be
+    treated as read-only; filter or copy them before modifying.
+    
+    Args:
+        chunksize: Rows per chunk for the streaming Projects.csv reader.
+            0 forces a full load; None streams only files larger than
+            STREAMING_THRESHOLD_BYTES.
+    
+    Returns:
+        Tuple containing (summary_df, projects_df)
+    """
+    streaming = use_streaming(projects_path, chunksize)
+    key = (summary_path, projects_path, streaming)
+    with _cache_lock:
+        cached = _load_cache.get(key)
+        try:
+            prev_summary, prev_projects = cached[0] if cached else (None, None)
+            fingerprints = (file_fingerprint(summary_path, prev_summary),
+                            file_fingerprint(projects_path, prev_projects))
+        except OSError:
+            # Let the uncached loader report the missing file
+            fingerprints = None
+        
+        previous_projects = None
+        if cached and fingerprints:
+            if _same_content(cached[0][0], fingerprints[0]) and _same_content(cached[0][1], fingerprints[1]):
+                # Touched but unchanged files only refresh their stat info
+                _load_cache[key] = (fingerprints, cached[1])
+                _cache_stats["hits"] += 1
+                return cached[1]
+            # Offer the cached frame as the base for an append-only update
+            previous_projects = (cached[0][1][1], cached[0][1][3], cached[1][1])
+        _cache_stats["misses"] += 1
+    
+    frames = _load_and_process_data_uncached(summary_path, projects_path, fingerprints,
+                                             (chunksize or STREAMING_CHUNK_ROWS) if streaming else None,
+                                             previous_projects)
+    
+    # Don't cache the empty fallback frames from a failed load
+    if fingerprints and not frames[1].empty:
+        with _cache_lock:
+            _load_cache[key] = (fingerprints, frames)
+    return frames
+
+
+def process_summary(summary_df: pd.DataFrame) -> pd.DataFrame:
+    """Clean a raw Summary.csv frame"""
+    # Clean up column names by removing leading/trailing spaces
+    summary_df.columns = summary_df.columns.str.strip()
+    return summary_df
+
+
+def process_projects(projects_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Clean a raw Projects.csv frame. Derived metrics are not added here;
+    they are computed on demand through get_metric/with_metrics.
+    """
+    # Clean up column names by removing leading/trailing spaces
+    projects_df.columns = projects_df.columns.str.strip()
+    
+    # Convert money, percentage and date columns in one pass each
+    clean_frame(projects_df)
+    
+    # Downcast numerics where exact
+    compact_frame(projects_df)
+    
+    return projects_df
+
+
+class DerivedMetric(NamedTuple):
+    """A column computed from others; ``requires`` lists columns or other metrics"""
+    requires: Tuple[str, ...]
+    compute: Callable[[pd.DataFrame], pd.Series]
+
+
+# Registry of derived metrics, computed on first access per frame
+DERIVED_METRICS: Dict[str, DerivedMetric] = {}
+
+# Metrics the loader used to add to every frame, still expected by the views
+DEFAULT_METRICS = ('Margin_Difference', 'Is_Negative_Margin',
+                   'Labor_Hours_Variance', 'Labor_Hours_Variance_Pct')
+
+
+def register_metric(name: str, requires: Tuple[str, ...]):
+    """Decorator registering a vectorized ``compute(df) -> Series`` as a derived metric"""
+    def decorator(compute: Callable[[pd.DataFrame], pd.Series]) -> Callable[[pd.DataFrame], pd.Series]:
+        DERIVED_METRICS[name] = DerivedMetric(tuple(requires), compute)
+        return compute
+    return decorator
+
+
+def has_metric(df: pd.DataFrame, name: str) -> bool:
+    """True if ``name`` is a column of ``df`` or a metric whose inputs it has"""
+    if name in df.columns:
+        return True
+    metric = DERIVED_METRICS.get(name)
+    return metric is not None and all(has_metric(df, column) for column in metric.requires)
+
+
+def get_metric(df: pd.DataFrame, name: str) -> pd.Series:
+    """
+    Return derived metric ``name`` for ``df``, computing it on first use.
+    
+    Results are memoized for the lifetime of the frame, i.e. once per
+    dataset version for the shared frames from load_and_process_data.
+    """
+    if name in df.columns:
+        return df[name]
+    if name not in DERIVED_METRICS:
+        raise KeyError(f"Unknown metric: {name}")
+    if not has_metric(df, name):
+        missing = [column for column in DERIVED_METRICS[name].requires if not has_metric(df, column)]
+        raise KeyError(f"Metric {name} needs missing columns: {missing}")
+    return _per_frame(df, f"metric:{name}",
+                      lambda: DERIVED_METRICS[name].compute(df).rename(name))
+
+
+def with_metrics(df: pd.DataFrame, names: Optional[Tuple[str, ...]] = None) -> pd.DataFrame:
+    """
+    Return ``df`` with the given metrics (default: every computable one)
+    added as columns. The result is memoized per frame and must be treated
+    as read-only; ``df`` itself is not modified.
+    """
+    names = tuple(DERIVED_METRICS) if names is None else tuple(names)
+    names = tuple(name for name in names if name not in df.columns and has_metric(df, name))
+    if not names:
+        return df
+    return _per_frame(df, "with_metrics:" + ",".join(names), lambda: _add_metrics(df, names))
+
+
+def _add_metrics(df: pd.DataFrame, names: Tuple[str, ...]) -> pd.DataFrame:
+    """A shallow copy of ``df`` with the metric columns added"""
+    # assign() deep-copies every column on pandas 2.x; a shallow copy
+    # keeps sharing the base columns with ``df``
+    out = df.copy(deep=False)
+    for name in names:
+        out[name] = get_metric(df, name)
+    return out
+
+
+@register_metric('Margin_Difference', requires=('Actual Margin %',))
+def _margin_difference(df: pd.DataFrame) -> pd.Series:
+    estimated = df['Estimated Margin %'] if 'Estimated Margin %' in df.columns else 0
+    return df['Actual Margin %'] - estimated
+
+
+@register_metric('Is_Negative_Margin', requires=('Actual Margin %',))
+def _is_negative_margin(df: pd.DataFrame) -> pd.Series:
+    return df['Actual Margin %'] < 0
+
+
+@register_metric('Labor_Hours_Variance', requires=('Quoted Labor Hours', 'Actual Labor Hours'))
+def _labor_hours_variance(df: pd.DataFrame) -> pd.Series:
+    return df['Actual Labor Hours'] - df['Quoted Labor Hours']
+
+
+@register_metric('Labor_Hours_Variance_Pct', requires=('Labor_Hours_Variance', 'Quoted Labor Hours'))
+def _labor_hours_variance_pct(df: pd.DataFrame) -> pd.Series:
+    return get_metric(df, 'Labor_Hours_Variance') / df['Quoted Labor Hours'].replace(0, np.nan)
+
+
+def _load_and_process_data_uncached(summary_path: str, projects_path: str,
+                                    fingerprints: Optional[Tuple[Fingerprint, Fingerprint]] = None,
+                                    chunksize: Optional[int] = None,
+                                    previous_projects: Optional[ProcessedPrefix] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
-    Load and process the dataset files for the dashboard
+    Load and process the dataset files for the dashboard, preferring a
+    valid sidecar over re-parsing each CSV. Projects.csv is streamed in
+    chunks when ``chunksize`` is given, and rows appended since
+    ``previous_projects`` or the last sidecar are processed on their own.
     
     Returns:
         Tuple containing (summary_df, projects_df)
     """
+    summary_fp, projects_fp = fingerprints if fingerprints else (None, None)
+    
     # Load the data
     try:
-        summary_df = pd.read_csv("attached_assets/Summary.csv")
-        projects_df = pd.read_csv("attached_assets/Projects.csv")
-        
-        # Clean up column names by removing leading/trailing spaces
-        summary_df.columns = summary_df.columns.str.strip()
-        projects_df.columns = projects_df.columns.str.strip()
-        
-        # Process projects data
-        # Convert monetary columns to float
-        money_columns = [col for col in projects_df.columns if 'Price' in col or 'Cost' in col or 'Margin' in col or 'Revenue' in col or 'Variance' in col]
-        for col in money_columns:
-            if projects_df[col].dtype == object:
-                projects_df[col] = projects_df[col].str.replace('$', '', regex=False) if isinstance(projects_df[col], pd.Series) else projects_df[col]
-                projects_df[col] = projects_df[col].str.replace(',', '', regex=False) if isinstance(projects_df[col], pd.Series) else projects_df[col]
-                projects_df[col] = projects_df[col].str.replace(' ', '', regex=False) if isinstance(projects_df[col], pd.Series) else projects_df[col]
-                projects_df[col] = pd.to_numeric(projects_df[col], errors='coerce')
-        
-        # Convert percentage columns
-        pct_columns = [col for col in projects_df.columns if '%' in col]
-        for col in pct_columns:
-            if projects_df[col].dtype == object:
-                projects_df[col] = projects_df[col].str.replace('%', '', regex=False) if isinstance(projects_df[col], pd.Series) else projects_df[col]
-                projects_df[col] = pd.to_numeric(projects_df[col], errors='coerce') / 100
-        
-        # Convert date columns
-        date_columns = [col for col in projects_df.columns if 'Date' in col]
-        for col in date_columns:
-            if projects_df[col].dtype == object:
-                projects_df[col] = pd.to_datetime(projects_df[col], errors='coerce')
-        
-        # Calculate derived metrics if needed
-        projects_df['Margin_Difference'] = projects_df['Actual Margin %'] - (projects_df['Estimated Margin %'] if 'Estimated Margin %' in projects_df.columns else 0)
-        
-        # Flag negative margin projects
-        projects_df['Is_Negative_Margin'] = projects_df['Actual Margin %'] < 0
-        
-        # Calculate labor hour variance
-        if 'Quoted Labor Hours' in projects_df.columns and 'Actual Labor Hours' in projects_df.columns:
-            projects_df['Labor_Hours_Variance'] = projects_df['Actual Labor Hours'] - projects_df['Quoted Labor Hours']
-            projects_df['Labor_Hours_Variance_Pct'] = projects_df['Labor_Hours_Variance'] / projects_df['Quoted Labor Hours'].replace(0, np.nan)
-        
+        summary_df = _load_with_sidecar(summary_path, summary_fp,
+                                        lambda path: process_summary(pd.read_csv(path)))
+        if chunksize:
+            projects_df = _load_with_sidecar(projects_path, projects_fp,
+                                             lambda path: load_projects_chunked(path, chunksize),
+                                             STREAMING_VARIANT,
+                                             lambda path, base, end: append_projects(path, base, end, chunksize),
+                                             previous_projects)
+        else:
+            projects_df = _load_with_sidecar(projects_path, projects_fp,
+                                             lambda path: process_projects(pd.read_csv(path)),
+                                             append=append_projects, previous=previous_projects)
         return summary_df, projects_df
         
     except Exception as e:
         print(f"Error loading or processing data: {e}")
         # Return empty dataframes if there's an error
         return pd.DataFrame(), pd.DataFrame()
+
+
+class SortedDateIndex:
+    """
+    Row positions of a frame ordered by one date column, so date-range
+    filters are two binary searches instead of full-column comparisons.
+    """
+    
+    def __init__(self, dates: pd.Series):
+        values = pd.to_datetime(dates, errors='coerce').to_numpy()
+        valid = np.flatnonzero(~np.isnat(values))
+        order = np.argsort(values[valid], kind='stable')
+        self.positions_by_date = valid[order]
+        self.sorted_dates = values[self.positions_by_date]
+    
+    def __len__(self) -> int:
+        return len(self.sorted_dates)
+    
+    @property
+    def min(self) -> pd.Timestamp:
+        """Earliest date, or NaT if the column has no dates"""
+        return pd.Timestamp(self.sorted_dates[0]) if len(self) else pd.NaT
+    
+    @property
+    def max(self) -> pd.Timestamp:
+        """Latest date, or NaT if the column has no dates"""
+        return pd.Timestamp(self.sorted_dates[-1]) if len(self) else pd.NaT
+    
+    def positions(self, start, end) -> np.ndarray:
+        """
+        Row positions with a date on or between the calendar days ``start``
+        and ``end`` (times within ``end`` included), in original row order.
+        """
+        start = np.datetime64(pd.Timestamp(start).normalize())
+        stop = np.datetime64(pd.Timestamp(end).normalize() + pd.Timedelta(days=1))
+        lo = np.searchsorted(self.sorted_dates, start, side='left')
+        hi = np.searchsorted(self.sorted_dates, stop, side='left')
+        return np.sort(self.positions_by_date[lo:hi])
+
+
+# Helper structures built once per frame, keyed by (id(frame), name) and
+# dropped when the frame is garbage collected
+_frame_lock = threading.Lock()
+_frame_objects: Dict[Tuple[int, str], object] = {}
+
+
+def _per_frame(df: pd.DataFrame, name: str, build: Callable[[], object]):
+    """Return the object cached under ``name`` for ``df``, building it on first use"""
+    key = (id(df), name)
+    with _frame_lock:
+        obj = _frame_objects.get(key)
+    if obj is None:
+        obj = build()
+        with _frame_lock:
+            if key not in _frame_objects:
+                weakref.finalize(df, _frame_objects.pop, key, None)
+                _frame_objects[key] = obj
+            obj = _frame_objects[key]
+    return obj
+
+
+def get_date_index(df: pd.DataFrame, column: str) -> SortedDateIndex:
+    """
+    Return the SortedDateIndex for ``df[column]``, building it on first use.
+    
+    Indexes live as long as the frame, so the shared frames returned by
+    load_and_process_data only sort their dates once per dataset version.
+    """
+    return _per_frame(df, f"date_index:{column}", lambda: SortedDateIndex(df[column]))
+
+
+# Filtered frames kept per FilterEngine; older filter states are evicted first
+FILTER_VIEW_CACHE_SIZE = 8
+FILTER_DATE_CACHE_SIZE = 32
+DATE_FILTER_COLUMN = 'Projected End Date'
+REGION_FILTER_COLUMN = 'Region'
+
+
+class FilterEngine:
+    """
+    Global dashboard filters over one shared frame.
+    
+    Rows are pre-partitioned by Region and date ranges are resolved through
+    the sorted date index, each as sorted row positions, so combining
+    filters is an intersection of integer arrays. Date-range lookups and
+    filtered frames are cached, so returning to a filter state hands back
+    the same frame without touching the rows again. Returned frames are
+    shared and must be treated as read-only.
+    """
+    
+    def __init__(self, df: pd.DataFrame, region_column: str = REGION_FILTER_COLUMN,
+                 date_column: str = DATE_FILTER_COLUMN):
+        # Weak, so the engine cached against the frame doesn't keep it alive
+        self._df = weakref.ref(df)
+        self.region_column = region_column
+        self.date_column = date_column
+        self._lock = threading.Lock()
+        self._date_cache: "OrderedDict[Tuple, np.ndarray]" = OrderedDict()
+        self._view_cache: "OrderedDict[Tuple, pd.DataFrame]" = OrderedDict()
+        self.stats = {"view_hits": 0, "view_misses": 0, "date_hits": 0, "date_misses": 0}
+        
+        if region_column in df.columns:
+            codes, self.region_names = pd.factorize(df[region_column], sort=True)
+            self.region_codes = codes
+            order = np.argsort(codes, kind='stable')
+            bounds = np.searchsorted(codes[order], np.arange(len(self.region_names) + 1))
+            self.region_positions = {
+                name: order[bounds[i]:bounds[i + 1]] for i, name in enumerate(self.region_names)
+            }
+        else:
+            self.region_codes = None
+            self.region_names = pd.Index([])
+            self.region_positions = {}
+    
+    @property
+    def df(self) -> pd.DataFrame:
+        return self._df()
+    
+    @staticmethod
+    def _date_key(date_range) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+        if date_range is None:
+            return None
+        start, end = date_range
+        return pd.Timestamp(start).normalize(), pd.Timestamp(end).normalize()
+    
+    def date_positions(self, date_range) -> np.ndarray:
+        """Sorted row positions whose date falls in the (start, end) day range"""
+        key = self._date_key(date_range)
+        with self._lock:
+            positions = self._date_cache.get(key)
+            if positions is not None:
+                self._date_cache.move_to_end(key)
+                self.stats["date_hits"] += 1
+                return positions
+            self.stats["date_misses"] += 1
+        positions = get_date_index(self.df, self.date_column).positions(*key)
+        with self._lock:
+            self._date_cache[key] = positions
+            if len(self._date_cache) > FILTER_DATE_CACHE_SIZE:
+                self._date_cache.popitem(last=False)
+        return positions
+    
+    def positions(self, region: Optional[str] = None, date_range=None) -> Optional[np.ndarray]:
+        """
+        Sorted row positions matching every given filter, or None when no
+        filter applies. ``region`` None means all regions; ``date_range``
+        None means all dates.
+        """
+        selected = []
+        if region is not None:
+            selected.append(self.region_positions.get(region, np.empty(0, dtype=np.intp)))
+        if date_range is not None and self.date_column in self.df.columns:
+            selected.append(self.date_positions(date_range))
+        if not selected:
+            return None
+        return functools.reduce(lambda a, b: np.intersect1d(a, b, assume_unique=True), selected)
+    
+    def regions(self, date_range=None) -> List[str]:
+        """Sorted regions with at least one row in the date range"""
+        positions = self.positions(date_range=date_range)
+        if self.region_codes is None:
+            return []
+        codes = self.region_codes if positions is None else self.region_codes[positions]
+        present = np.unique(codes[codes >= 0])
+        return self.region_names[present].tolist()
+    
+    def view(self, region: Optional[str] = None, date_range=None) -> pd.DataFrame:
+        """Return the (cached) frame of rows matching the filters"""
+        if region is None and date_range is None:
+            return self.df
+        key = (region, self._date_key(date_range))
+        with self._lock:
+            df = self._view_cache.get(key)
+            if df is not None:
+                self._view_cache.move_to_end(key)
+                self.stats["view_hits"] += 1
+                return df
+            self.stats["view_misses"] += 1
+        df = self.df.iloc[self.positions(region, date_range)]
+        with self._lock:
+            self._view_cache[key] = df
+            if len(self._view_cache) > FILTER_VIEW_CACHE_SIZE:
+                self._view_cache.popitem(last=False)
+        return df
+
+
+def get_filter_engine(df: pd.DataFrame) -> FilterEngine:
+    """Return the FilterEngine for ``df``, built once per frame"""
+    return _per_frame(df, "filter_engine", lambda: FilterEngine(df))
+
+
+# Rollup cube: additive aggregates per Region x month x Owner cell. Means
+# are stored as sum and non-null count so any set of cells combines exactly.
+ROLLUP_DIMENSIONS = ('Region', 'Month', 'Owner')
+ROLLUP_SUM_MEASURES = (
+    'Calculated Total Install Price $', 'Total Costs Variance $', 'Labor Variance $',
+    'Parts Variance $', 'Quoted Labor Hours', 'Actual Labor Hours',
+)
+ROLLUP_MEAN_MEASURES = ('Estimated Margin %', 'Actual Margin %')
+ROLLUP_COUNT = 'Project Count'
+
+
+class RollupCube:
+    """
+    Pre-aggregated project measures by Region, month of the Projected End
+    Date and Owner, built once per frame.
+    
+    summarize() answers filtered or regrouped summaries by adding up cube
+    cells instead of grouping the project rows again.
+    """
+    
+    def __init__(self, df: pd.DataFrame, date_column: str = DATE_FILTER_COLUMN):
+        keys = {}
+        if 'Region' in df.columns:
+            keys['Region'] = df['Region']
+        if date_column in df.columns:
+            keys['Month'] = pd.to_datetime(df[date_column], errors='coerce').dt.to_period('M')
+        if 'Owner' in df.columns:
+            keys['Owner'] = df['Owner']
+        self.dimensions = tuple(keys)
+        self.sum_measures = tuple(c for c in ROLLUP_SUM_MEASURES if c in df.columns)
+        self.mean_measures = tuple(c for c in ROLLUP_MEAN_MEASURES if c in df.columns)
+        
+        frame = pd.DataFrame(keys, index=df.index)
+        frame[ROLLUP_COUNT] = 1
+        for column in self.sum_measures + self.mean_measures:
+            frame[f"{column} sum"] = pd.to_numeric(df[column], errors='coerce')
+        for column in self.mean_measures:
+            frame[f"{column} count"] = frame[f"{column} sum"].notna()
+        self.measure_columns = [c for c in frame.columns if c not in keys]
+        
+        if keys:
+            self.cells = frame.groupby(list(keys), observed=True, dropna=False, sort=True).sum().reset_index()
+        else:
+            self.cells = pd.DataFrame({c: [frame[c].sum()] for c in self.measure_columns})
+    
+    def summarize(self, by: Tuple[str, ...] = ('Region',), regions: Optional[List[str]] = None,
+                  owners: Optional[List[str]] = None, start=None, end=None) -> pd.DataFrame:
+        """
+        Summarize the projects matching the filters, grouped by any of
+        ROLLUP_DIMENSIONS (or overall if ``by`` is empty).
+        
+        ``start`` and ``end`` select whole months. Sum measures keep their
+        column names, mean measures hold the mean, and ROLLUP_COUNT holds
+        the number of projects.
+        """
+        cells = self.cells
+        mask = np.ones(len(cells), dtype=bool)
+        if regions is not None and 'Region' in self.dimensions:
+            mask &= cells['Region'].isin(regions).to_numpy()
+        if owners is not None and 'Owner' in self.dimensions:
+            mask &= cells['Owner'].isin(owners).to_numpy()
+        if start is not None and 'Month' in self.dimensions:
+            mask &= (cells['Month'] >= pd.Period(start, 'M')).to_numpy()
+        if end is not None and 'Month' in self.dimensions:
+            mask &= (cells['Month'] <= pd.Period(end, 'M')).to_numpy()
+        selected = cells[mask]
+        
+        by = [dimension for dimension in by if dimension in self.dimensions]
+        if by:
+            totals = selected.groupby(by, observed=True, dropna=False, sort=True)[self.measure_columns].sum()
+        else:
+            totals = pd.DataFrame({c: [selected[c].sum()] for c in self.measure_columns})
+        
+        summary = pd.DataFrame({ROLLUP_COUNT: totals[ROLLUP_COUNT]}, index=totals.index)
+        for column in self.sum_measures:
+            summary[column] = totals[f"{column} sum"]
+        for column in self.mean_measures:
+            summary[column] = totals[f"{column} sum"] / totals[f"{column} count"].replace(0, np.nan)
+        return summary.reset_index() if by else summary.reset_index(drop=True)
+
+
+def get_rollup_cube(df: pd.DataFrame) -> RollupCube:
+    """Return the RollupCube for ``df``, built once per frame"""
+    return _per_frame(df, "rollup_cube", lambda: RollupCube(df))
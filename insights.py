@@ -0,0 +1,388 @@
+"""
+Summaries of negative margin projects for the AI analysis: aggregate
+statistics over every loss-making project plus a small sample of the
+worst ones, rendered into a prompt that fits a token budget.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+from data_processor import get_metric, has_metric
+
+MARGIN_COLUMN = 'Actual Margin %'
+COST_VARIANCE_COLUMN = 'Total Costs Variance $'
+PRICE_COLUMN = 'Calculated Total Install Price $'
+
+# Prompts are sized by a characters-per-token estimate, close enough for
+# English and CSV text to keep requests within budget without a tokenizer
+PROMPT_TOKEN_BUDGET = 600
+CHARS_PER_TOKEN = 4
+PROMPT_SAMPLE_ROWS = 8
+PROMPT_TOP_GROUPS = 5
+NOTE_MAX_CHARS = 80
+
+SAMPLE_COLUMNS = [
+    'Topic', 'Region', 'Owner', MARGIN_COLUMN, COST_VARIANCE_COLUMN,
+    'Quoted Labor Hours', 'Actual Labor Hours', 'Labor Variance $',
+    'Parts Variance $', PRICE_COLUMN,
+]
+
+PROMPT_INSTRUCTIONS = """\
+I'm analyzing financial data for projects with negative margins. Below are
+statistics over all negative margin projects, followed by a sample of the
+ones with the lowest margins and largest cost variances.
+
+Based on this data, please provide:
+1. 5-6 bullet points identifying common issues or patterns in these negative margin projects
+2. 3-4 actionable recommendations for improving profitability on future projects
+3. A brief analysis of the relationship between quoted vs. actual labor hours in these projects
+
+Format your response as markdown with clear sections.
+Focus on practical, data-driven insights that can help improve project performance.
+"""
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of ``text``"""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def notes_column(df: pd.DataFrame) -> Optional[str]:
+    """The free-text notes column of a projects frame, if it has one"""
+    return next((col for col in df.columns if 'Notes' in col or 'Performance' in col), None)
+
+
+def _column(df: pd.DataFrame, column: str, mask: np.ndarray) -> Optional[np.ndarray]:
+    """Float values of a column or metric for the masked rows, or None if missing"""
+    if not has_metric(df, column):
+        return None
+    return get_metric(df, column).to_numpy(dtype=float, na_value=np.nan)[mask]
+
+
+def _group_codes(series: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """Integer group codes, -1 for missing or blank values, and the group labels"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes, labels = series.cat.codes.to_numpy(), series.cat.categories
+    else:
+        codes, labels = pd.factorize(series)
+    blank = np.asarray(labels.astype(str).str.strip() == '')
+    if blank.any():
+        remap = np.where(blank, -1, np.arange(len(labels)))
+        codes = np.where(codes >= 0, remap[codes], -1)
+    return codes, labels
+
+
+def _group_counts(codes: np.ndarray, labels: pd.Index, mask: np.ndarray) -> np.ndarray:
+    """Number of masked rows in each group"""
+    return np.bincount(codes[mask & (codes >= 0)], minlength=len(labels))
+
+
+def _ranked(table, column: Optional[str] = None):
+    """Sort a group table or counts descending, ties by label, so row order doesn't matter"""
+    by_label = table.iloc[np.argsort(table.index.astype(str), kind='stable')]
+    if column is None:
+        return by_label.sort_values(ascending=False, kind='stable')
+    return by_label.sort_values(column, ascending=False, kind='stable')
+
+
+def _top_groups(projects_df: pd.DataFrame, mask: np.ndarray, by: str, limit: int) -> pd.DataFrame:
+    """Loss count and summed cost variance per group, most projects first"""
+    codes, labels = _group_codes(projects_df[by])
+    table = pd.DataFrame({'projects': _group_counts(codes, labels, mask)}, index=labels)
+    if COST_VARIANCE_COLUMN in projects_df.columns:
+        variance = projects_df[COST_VARIANCE_COLUMN].to_numpy(dtype=float, na_value=np.nan)
+        valid = mask & (codes >= 0)
+        table['cost_variance'] = np.bincount(codes[valid], weights=np.nan_to_num(variance[valid]),
+                                             minlength=len(labels))
+    return _ranked(table[table['projects'] > 0], 'projects').head(limit)
+
+
+def negative_margin_stats(projects_df: pd.DataFrame, top_groups: int = PROMPT_TOP_GROUPS) -> Dict[str, Any]:
+    """
+    Aggregate statistics over every project with a negative actual margin.
+    Statistics whose columns are missing from ``projects_df`` are left out.
+    """
+    margin = projects_df[MARGIN_COLUMN].to_numpy(dtype=float, na_value=np.nan)
+    mask = margin < 0
+    count = int(mask.sum())
+    stats: Dict[str, Any] = {'projects': len(projects_df), 'negative': count}
+    if not count:
+        return stats
+    losses = margin[mask]
+    stats['margin_quantiles'] = dict(zip(('min', 'p10', 'median'), np.quantile(losses, [0.0, 0.1, 0.5])))
+    for key, column in (('revenue', PRICE_COLUMN), ('cost_variance', COST_VARIANCE_COLUMN),
+                        ('labor_variance', 'Labor Variance $'), ('parts_variance', 'Parts Variance $')):
+        values = _column(projects_df, column, mask)
+        if values is not None:
+            stats[key] = float(np.nansum(values))
+    quoted = _column(projects_df, 'Quoted Labor Hours', mask)
+    overrun = _column(projects_df, 'Labor_Hours_Variance_Pct', mask)
+    if quoted is not None and overrun is not None:
+        actual = _column(projects_df, 'Actual Labor Hours', mask)
+        valid = overrun[~np.isnan(overrun)]
+        stats['labor_hours'] = {
+            'quoted': float(np.nansum(quoted)),
+            'actual': float(np.nansum(actual)),
+            'overrun_share': float((valid > 0).mean()) if len(valid) else float('nan'),
+            'overrun_quantiles': dict(zip(('median', 'p90'), np.quantile(valid, [0.5, 0.9])))
+                                 if len(valid) else {},
+        }
+    for by in ('Region', 'Owner'):
+        if by in projects_df.columns:
+            stats[f'by_{by.lower()}'] = _top_groups(projects_df, mask, by, top_groups)
+    notes = notes_column(projects_df)
+    if notes is not None:
+        codes, labels = _group_codes(projects_df[notes])
+        counts = pd.Series(_group_counts(codes, labels, mask), index=labels.astype(str))
+        stats['notes'] = _ranked(counts[counts > 0]).head(top_groups)
+    return stats
+
+
+def representative_sample(projects_df: pd.DataFrame, rows: int = PROMPT_SAMPLE_ROWS) -> pd.DataFrame:
+    """
+    Up to ``rows`` negative margin projects, alternating the lowest margins
+    and the largest absolute cost variances, most extreme first.
+    """
+    margin = projects_df[MARGIN_COLUMN].to_numpy(dtype=float, na_value=np.nan)
+    positions = np.flatnonzero(margin < 0)
+    rankings = [positions[np.argsort(margin[positions], kind='stable')[:rows]]]
+    if COST_VARIANCE_COLUMN in projects_df.columns:
+        variance = projects_df[COST_VARIANCE_COLUMN].to_numpy(dtype=float, na_value=0.0)[positions]
+        rankings.append(positions[np.argsort(-np.abs(variance), kind='stable')[:rows]])
+    interleaved = np.column_stack(rankings).ravel() if len(rankings) > 1 else rankings[0]
+    chosen = list(dict.fromkeys(interleaved.tolist()))[:rows]
+    columns = [col for col in SAMPLE_COLUMNS if col in projects_df.columns]
+    notes = notes_column(projects_df)
+    if notes is not None:
+        columns.append(notes)
+    sample = projects_df.iloc[chosen][columns]
+    if notes is not None:
+        sample = sample.assign(**{notes: sample[notes].astype(object).astype(str).str.slice(0, NOTE_MAX_CHARS)})
+    return sample
+
+
+def _money(value: float) -> str:
+    return f"-${-value:,.0f}" if value < 0 else f"${value:,.0f}"
+
+
+def _group_lines(title: str, table: pd.DataFrame) -> List[str]:
+    lines = [f"{title}:"]
+    for name, row in table.iterrows():
+        line = f"- {name}: {int(row['projects'])} projects"
+        if 'cost_variance' in row:
+            line += f", cost variance {_money(row['cost_variance'])}"
+        lines.append(line)
+    return lines
+
+
+def format_stats(stats: Dict[str, Any]) -> str:
+    """Render negative_margin_stats as compact plain text"""
+    count, total = stats['negative'], stats['projects']
+    lines = [f"Negative margin projects: {count} of {total} ({count / total:.1%})" if total
+             else "Negative margin projects: 0"]
+    if 'margin_quantiles' in stats:
+        q = stats['margin_quantiles']
+        lines.append(f"Actual margin: median {q['median']:.1%}, 10th percentile {q['p10']:.1%}, worst {q['min']:.1%}")
+    for key, label in (('revenue', "Install price"), ('cost_variance', "Total costs variance"),
+                       ('labor_variance', "Labor variance"), ('parts_variance', "Parts variance")):
+        if key in stats:
+            lines.append(f"{label} (sum): {_money(stats[key])}")
+    hours = stats.get('labor_hours')
+    if hours:
+        line = (f"Labor hours: {hours['quoted']:,.0f} quoted vs {hours['actual']:,.0f} actual; "
+                f"{hours['overrun_share']:.0%} of projects over quote")
+        if hours['overrun_quantiles']:
+            line += (f", median overrun {hours['overrun_quantiles']['median']:.0%}, "
+                     f"90th percentile {hours['overrun_quantiles']['p90']:.0%}")
+        lines.append(line)
+    for key, title in (('by_region', "Regions with most negative margin projects"),
+                       ('by_owner', "Owners with most negative margin projects")):
+        if key in stats and len(stats[key]):
+            lines.extend(_group_lines(title, stats[key]))
+    if 'notes' in stats and len(stats['notes']):
+        lines.append("Most common notes:")
+        lines.extend(f"- {note[:NOTE_MAX_CHARS]} ({n})" for note, n in stats['notes'].items())
+    return "\n".join(lines)
+
+
+def _sample_csv(sample: pd.DataFrame) -> str:
+    """Sample rows as CSV with margins as percentages and money in whole dollars"""
+    formatted = {}
+    for column in sample.columns:
+        values = sample[column]
+        if column == MARGIN_COLUMN:
+            formatted[column] = (values * 100).round(1).astype(str) + '%'
+        elif column.endswith('$'):
+            formatted[column] = values.round().astype('Int64')
+    return sample.assign(**formatted).to_csv(index=False)
+
+
+def build_negative_margin_prompt(projects_df: pd.DataFrame,
+                                 token_budget: int = PROMPT_TOKEN_BUDGET) -> str:
+    """
+    Build the AI analysis prompt: instructions, statistics over all
+    negative margin projects, then as many sample rows as fit in
+    ``token_budget`` (the statistics are always included).
+    """
+    prompt = f"{PROMPT_INSTRUCTIONS}\nStatistics:\n{format_stats(negative_margin_stats(projects_df))}\n"
+    sample = representative_sample(projects_df)
+    if not len(sample):
+        return prompt
+    header, *rows = _sample_csv(sample).splitlines()
+    section = f"\nSample projects (CSV):\n{header}\n"
+    remaining = token_budget * CHARS_PER_TOKEN - len(prompt) - len(section)
+    kept = []
+    for row in rows:
+        remaining -= len(row) + 1
+        if remaining < 0:
+            break
+        kept.append(row)
+    if not kept:
+        return prompt
+    return prompt + section + "\n".join(kept) + "\n"
+
+
+# Local analysis: findings computed directly from the data, used instead
+# of the model's when there is no API key or the model call fails. A
+# region, owner or note is only called out when losses are at least
+# LOCAL_MIN_LIFT times as common there as overall, and it has
+# LOCAL_MIN_GROUP_PROJECTS projects.
+LOCAL_MIN_GROUP_PROJECTS = 10
+LOCAL_MIN_LIFT = 1.2
+LOCAL_TOP_OWNERS = 3
+
+
+def _loss_rates(projects_df: pd.DataFrame, mask: np.ndarray, by: str) -> pd.DataFrame:
+    """Projects, negative margin projects and their rate per group, highest rate first"""
+    codes, labels = _group_codes(projects_df[by])
+    everything = np.ones(len(codes), dtype=bool)
+    table = pd.DataFrame({'negative': _group_counts(codes, labels, mask),
+                          'projects': _group_counts(codes, labels, everything)}, index=labels)
+    table = table[table['projects'] >= LOCAL_MIN_GROUP_PROJECTS]
+    table['rate'] = table['negative'] / table['projects']
+    return _ranked(table, 'rate')
+
+
+def _variance_drivers(projects_df: pd.DataFrame, mask: np.ndarray) -> Optional[Dict[str, float]]:
+    """How often and by how much labor rather than parts variance dominates on losses"""
+    labor = _column(projects_df, 'Labor Variance $', mask)
+    parts = _column(projects_df, 'Parts Variance $', mask)
+    if labor is None or parts is None:
+        return None
+    labor, parts = np.abs(labor), np.abs(parts)
+    valid = ~(np.isnan(labor) | np.isnan(parts)) & ((labor > 0) | (parts > 0))
+    if not valid.any():
+        return None
+    labor, parts = labor[valid], parts[valid]
+    return {
+        'labor_larger': float((labor > parts).mean()),
+        'labor_amount_share': float(labor.sum() / (labor.sum() + parts.sum())),
+    }
+
+
+def _overrepresented_note(projects_df: pd.DataFrame, mask: np.ndarray) -> Optional[Tuple[str, float, float]]:
+    """The note most over-represented on losses: (note, share of losses, share of all projects)"""
+    notes = notes_column(projects_df)
+    if notes is None:
+        return None
+    codes, labels = _group_codes(projects_df[notes])
+    losses = _group_counts(codes, labels, mask)
+    eligible = losses >= LOCAL_MIN_GROUP_PROJECTS
+    if not eligible.any():
+        return None
+    loss_share = losses / int(mask.sum())
+    overall_share = _group_counts(codes, labels, np.ones(len(codes), dtype=bool)) / len(projects_df)
+    lift = np.divide(loss_share, overall_share, out=np.full(len(labels), -np.inf), where=eligible)
+    by_label = np.argsort(labels.astype(str), kind='stable')
+    note = int(by_label[np.argmax(lift[by_label])])
+    return str(labels[note])[:NOTE_MAX_CHARS], float(loss_share[note]), float(overall_share[note])
+
+
+def local_negative_margin_analysis(projects_df: pd.DataFrame) -> str:
+    """
+    Analyze negative margin projects without a model: margin depth, labor
+    hour overruns, labor vs parts variance, and the regions, owners and
+    notes where losses concentrate, as markdown in the same sections as
+    the AI analysis. Deterministic for a given frame.
+    """
+    stats = negative_margin_stats(projects_df)
+    count, total = stats['negative'], stats['projects']
+    if not count:
+        return ("## Common Issues in Negative Margin Projects\n\n"
+                f"* None of the {total:,} projects has a negative actual margin\n\n"
+                "## Recommendations\n\n"
+                "* Keep comparing quoted and actual labor hours so overruns are caught early\n")
+    margin = projects_df[MARGIN_COLUMN].to_numpy(dtype=float, na_value=np.nan)
+    mask = margin < 0
+    issues, recommendations = [], []
+
+    q = stats['margin_quantiles']
+    line = (f"{count:,} of {total:,} projects ({count / total:.1%}) have a negative actual margin "
+            f"(median {q['median']:.1%}, worst {q['min']:.1%})")
+    if 'revenue' in stats:
+        line += f", covering {_money(stats['revenue'])} of install price"
+    issues.append(line)
+
+    hours = stats.get('labor_hours')
+    if hours and hours['overrun_quantiles']:
+        median = hours['overrun_quantiles']['median']
+        line = (f"{hours['overrun_share']:.0%} of negative margin projects used more labor hours than quoted "
+                f"(median overrun {median:.0%}, 90th percentile {hours['overrun_quantiles']['p90']:.0%})")
+        others = _column(projects_df, 'Labor_Hours_Variance_Pct', ~mask)
+        others = others[~np.isnan(others)] if others is not None else others
+        if others is not None and len(others):
+            line += f", against a median of {np.median(others):.0%} on the other projects"
+        issues.append(line)
+        if hours['overrun_share'] >= 0.5:
+            recommendations.append(
+                f"Recalibrate labor estimates: quoted hours on loss-making projects were exceeded "
+                f"by a median of {median:.0%}, so add contingency or revisit the hour standards behind quotes")
+
+    drivers = _variance_drivers(projects_df, mask)
+    if drivers:
+        issues.append(f"Labor variance outweighs parts variance on {drivers['labor_larger']:.0%} of negative margin "
+                      f"projects and makes up {drivers['labor_amount_share']:.0%} of their combined labor and "
+                      "parts variance")
+        if drivers['labor_amount_share'] >= 0.5:
+            recommendations.append("Prioritize labor cost control (crew planning and productivity tracking) "
+                                   "over parts, since labor drives most of the variance on losses")
+        else:
+            recommendations.append("Tighten parts purchasing and pricing, since parts drive most of the "
+                                   "variance on losses")
+
+    overall_rate = count / total
+    if 'Region' in projects_df.columns:
+        regions = _loss_rates(projects_df, mask, 'Region')
+        if len(regions) > 1 and regions['rate'].iloc[0] >= LOCAL_MIN_LIFT * overall_rate:
+            region, row = regions.index[0], regions.iloc[0]
+            issues.append(f"{region} has the highest share of negative margin projects: {row['rate']:.1%} of its "
+                          f"{int(row['projects']):,} projects, against {overall_rate:.1%} overall")
+            recommendations.append(f"Review pricing and estimating in {region}, where losses are most frequent")
+
+    if 'Owner' in projects_df.columns:
+        owners = _loss_rates(projects_df, mask, 'Owner')
+        owners = owners[owners['rate'] >= LOCAL_MIN_LIFT * overall_rate].head(LOCAL_TOP_OWNERS)
+        if len(owners):
+            names = ", ".join(str(name) for name in owners.index)
+            rates = ", ".join(f"{name} ({rate:.0%})" for name, rate in owners['rate'].items())
+            issues.append(f"Losses are most frequent on projects owned by {rates}, against "
+                          f"{overall_rate:.0%} overall")
+            recommendations.append(f"Review project mix and estimating with {names}")
+
+    note = _overrepresented_note(projects_df, mask)
+    if note is not None and note[1] >= LOCAL_MIN_LIFT * note[2]:
+        text, loss_share, overall_share = note
+        issues.append(f"\"{text}\" is noted on {loss_share:.0%} of negative margin projects, against "
+                      f"{overall_share:.0%} of all projects")
+        recommendations.append(f"Follow up on projects noted \"{text}\", the note most over-represented "
+                               "among losses")
+
+    if len(recommendations) < 3:
+        recommendations.append("Track actual against quoted hours and costs while projects are in progress "
+                               "so overruns are caught before close-out")
+
+    return ("## Common Issues in Negative Margin Projects\n\n"
+            + "".join(f"* {issue}\n" for issue in issues)
+            + "\n## Recommendations\n\n"
+            + "".join(f"* {recommendation}\n" for recommendation in recommendations))
@@ -0,0 +1,250 @@
+"""
+Language model backends for the AI analysis, behind one small interface
+with per-attempt timeouts, retries with backoff and an overall deadline.
+
+The Gemini backend holds one configured client for the life of the
+process. The stub backend answers in-process with configurable latency
+and failures, so the analysis path can be run and benchmarked offline.
+Set LLM_BACKEND=stub in the environment to use it by default.
+"""
+
+import abc
+import os
+import random
+import threading
+import time
+from typing import Callable, Dict, Iterator, Optional
+
+try:
+    from google.api_core import exceptions as google_exceptions
+except ImportError:  # Only the Gemini backend needs google-api-core
+    google_exceptions = None
+
+GEMINI_MODEL_NAME = 'gemini-1.5-pro'
+GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "")
+DEFAULT_BACKEND = os.environ.get("LLM_BACKEND", "gemini")
+
+# Each attempt must produce its first chunk within LLM_TIMEOUT_SECONDS;
+# failed attempts are retried with exponential backoff and jitter until
+# LLM_RETRIES retries or LLM_DEADLINE_SECONDS in total have been spent
+LLM_TIMEOUT_SECONDS = 60.0
+LLM_RETRIES = 3
+LLM_BACKOFF_SECONDS = 1.0
+LLM_BACKOFF_MAX_SECONDS = 8.0
+LLM_DEADLINE_SECONDS = 180.0
+
+_llm_lock = threading.Lock()
+_llm_stats = {"calls": 0, "attempts": 0, "retries": 0, "timeouts": 0, "failures": 0}
+_backend: Optional["LLMBackend"] = None
+
+
+class TransientLLMError(Exception):
+    """A failure worth retrying: overload, rate limiting, a dropped connection"""
+
+
+def _transient_errors() -> tuple:
+    errors = (TransientLLMError, TimeoutError, ConnectionError)
+    if google_exceptions is not None:
+        errors += (google_exceptions.ServiceUnavailable, google_exceptions.DeadlineExceeded,
+                   google_exceptions.ResourceExhausted, google_exceptions.InternalServerError,
+                   google_exceptions.TooManyRequests)
+    return errors
+
+
+_TRANSIENT_ERRORS = _transient_errors()
+
+
+class LLMBackend(abc.ABC):
+    """
+    A source of model responses. ``name`` identifies the model in cache
+    keys, so responses from different backends are never mixed up.
+    """
+
+    name = "backend"
+
+    @property
+    def ready(self) -> bool:
+        """False if the backend is missing credentials and can't be called"""
+        return True
+
+    @abc.abstractmethod
+    def stream(self, prompt: str, timeout: float) -> Iterator[str]:
+        """Yield the response to ``prompt`` in chunks; raise TimeoutError past ``timeout``"""
+
+
+class GeminiBackend(LLMBackend):
+    """Google Gemini through one long-lived GenerativeModel"""
+
+    def __init__(self, model_name: str = GEMINI_MODEL_NAME, api_key: Optional[str] = GEMINI_API_KEY):
+        self.name = model_name
+        self.api_key = api_key
+        self._model = None
+        self._model_lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return bool(self.api_key)
+
+    def _client(self):
+        with self._model_lock:
+            if self._model is None:
+                import google.generativeai as genai
+                genai.configure(api_key=self.api_key)
+                self._model = genai.GenerativeModel(self.name)
+            return self._model
+
+    def stream(self, prompt: str, timeout: float) -> Iterator[str]:
+        # Retries are handled by generate_stream, not the client library
+        response = self._client().generate_content(
+            prompt, stream=True, request_options={"timeout": timeout, "retry": None})
+        for chunk in response:
+            try:
+                text = chunk.text
+            except ValueError:  # Chunks without text parts, e.g. safety feedback
+                continue
+            if text:
+                yield text
+
+
+class StubBackend(LLMBackend):
+    """
+    In-process stand-in for a model service. Waits ``latency`` seconds
+    before the first chunk and ``chunk_delay`` between chunks; the first
+    ``fail_first`` calls, and then a ``failure_rate`` share of calls, raise
+    TransientLLMError. The response is a fixed markdown report, or
+    ``respond(prompt)`` when given.
+    """
+
+    name = "stub"
+
+    def __init__(self, latency: float = 0.0, chunk_delay: float = 0.0, chunks: int = 4,
+                 fail_first: int = 0, failure_rate: float = 0.0, seed: int = 0,
+                 respond: Optional[Callable[[str], str]] = None):
+        self.latency = latency
+        self.chunk_delay = chunk_delay
+        self.chunks = chunks
+        self.fail_first = fail_first
+        self.failure_rate = failure_rate
+        self.respond = respond
+        self.calls = 0
+        self._random = random.Random(seed)
+        self._calls_lock = threading.Lock()
+
+    def _response(self, prompt: str) -> str:
+        if self.respond is not None:
+            return self.respond(prompt)
+        rows = max(prompt.count("\n") - 12, 0)
+        return (
+            "## Common Issues in Negative Margin Projects\n\n"
+            f"* Stub analysis of a {len(prompt):,} character prompt ({rows} data lines)\n\n"
+            "## Recommendations\n\n"
+            "* Run with a real model backend for an actual analysis\n"
+        )
+
+    def stream(self, prompt: str, timeout: float) -> Iterator[str]:
+        with self._calls_lock:
+            self.calls += 1
+            fail = self.calls <= self.fail_first or self._random.random() < self.failure_rate
+        if self.latency > timeout:
+            time.sleep(timeout)
+            raise TimeoutError(f"stub backend took longer than {timeout:g}s")
+        time.sleep(self.latency)
+        if fail:
+            raise TransientLLMError("stub backend unavailable")
+        text = self._response(prompt)
+        size = -(-len(text) // max(self.chunks, 1))
+        for start in range(0, len(text), size):
+            if start:
+                time.sleep(self.chunk_delay)
+            yield text[start:start + size]
+
+
+def make_backend(kind: str) -> LLMBackend:
+    """Build a backend by name: "gemini" or "stub" """
+    if kind == "gemini":
+        return GeminiBackend()
+    if kind == "stub":
+        return StubBackend()
+    raise ValueError(f"Unknown LLM backend {kind!r}")
+
+
+def get_backend() -> LLMBackend:
+    """Return the process-wide backend, creating DEFAULT_BACKEND on first use"""
+    global _backend
+    with _llm_lock:
+        if _backend is None:
+            _backend = make_backend(DEFAULT_BACKEND)
+        return _backend
+
+
+def set_backend(backend: Optional[LLMBackend]) -> None:
+    """Replace the process-wide backend; None goes back to DEFAULT_BACKEND"""
+    global _backend
+    with _llm_lock:
+        _backend = backend
+
+
+def get_llm_stats() -> Dict[str, int]:
+    """Return counters for calls, attempts, retries, timeouts and failed calls"""
+    with _llm_lock:
+        return dict(_llm_stats)
+
+
+def clear_llm_stats() -> None:
+    """Reset the call counters"""
+    with _llm_lock:
+        for key in _llm_stats:
+            _llm_stats[key] = 0
+
+
+def _count(key: str) -> None:
+    with _llm_lock:
+        _llm_stats[key] += 1
+
+
+def generate_stream(prompt: str, backend: Optional[LLMBackend] = None,
+                    timeout: Optional[float] = None, retries: Optional[int] = None,
+                    deadline: Optional[float] = None) -> Iterator[str]:
+    """
+    Yield the response to ``prompt`` in chunks, retrying transient errors
+    with exponential backoff. Once a chunk has been yielded the attempt is
+    not retried, so callers never see repeated text. Settings default to
+    the LLM_* constants.
+    """
+    backend = backend or get_backend()
+    timeout = LLM_TIMEOUT_SECONDS if timeout is None else timeout
+    retries = LLM_RETRIES if retries is None else retries
+    deadline = time.monotonic() + (LLM_DEADLINE_SECONDS if deadline is None else deadline)
+    _count("calls")
+    attempt = 0
+    while True:
+        _count("attempts")
+        started = False
+        try:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("LLM deadline exceeded")
+            for chunk in backend.stream(prompt, min(timeout, remaining)):
+                started = True
+                yield chunk
+            return
+        except _TRANSIENT_ERRORS as e:
+            if isinstance(e, TimeoutError) or (google_exceptions is not None
+                                                and isinstance(e, google_exceptions.DeadlineExceeded)):
+                _count("timeouts")
+            backoff = min(LLM_BACKOFF_SECONDS * 2 ** attempt, LLM_BACKOFF_MAX_SECONDS)
+            backoff *= 0.5 + random.random() / 2
+            if started or attempt >= retries or time.monotonic() + backoff >= deadline:
+                _count("failures")
+                raise
+            attempt += 1
+            _count("retries")
+            time.sleep(backoff)
+        except Exception:
+            _count("failures")
+            raise
+
+
+def generate(prompt: str, backend: Optional[LLMBackend] = None, **kwargs) -> str:
+    """The complete response to ``prompt``; see generate_stream for the settings"""
+    return "".join(generate_stream(prompt, backend, **kwargs))